@@ -41,7 +41,7 @@ def setup_websocket_handlers(socketio):
                 'message': f'Joined simulation {simulation_id}',
                 'timestamp': datetime.utcnow().isoformat()
             })
-            logger.info(f'Client joined simulation room: {simulation_id}')
+            logger.info('Client joined simulation room: %s', simulation_id)
     
     @socketio.on('leave_simulation', namespace='/simulation')
     def on_leave_simulation(data):
@@ -54,7 +54,7 @@ def setup_websocket_handlers(socketio):
                 'message': f'Left simulation {simulation_id}',
                 'timestamp': datetime.utcnow().isoformat()
             })
-            logger.info(f'Client left simulation room: {simulation_id}')
+            logger.info('Client left simulation room: %s', simulation_id)
     
     @socketio.on('request_simulation_status', namespace='/simulation')
     def on_request_simulation_status(data):
@@ -109,7 +109,7 @@ def setup_websocket_handlers(socketio):
             'message': f'Subscribed to metrics: {", ".join(metric_types)}',
             'timestamp': datetime.utcnow().isoformat()
         })
-        logger.info(f'Client subscribed to metrics: {metric_types}')
+        logger.info('Client subscribed to metrics: %s', metric_types)
     
     @socketio.on('unsubscribe_metrics', namespace='/metrics')
     def on_unsubscribe_metrics(data):
@@ -124,7 +124,7 @@ def setup_websocket_handlers(socketio):
             'message': f'Unsubscribed from metrics: {", ".join(metric_types)}',
             'timestamp': datetime.utcnow().isoformat()
         })
-        logger.info(f'Client unsubscribed from metrics: {metric_types}')
+        logger.info('Client unsubscribed from metrics: %s', metric_types)
     
     # Logs namespace handlers
     @socketio.on('connect', namespace='/logs')
@@ -158,7 +158,7 @@ def setup_websocket_handlers(socketio):
             'message': 'Log filters updated',
             'timestamp': datetime.utcnow().isoformat()
         })
-        logger.info(f'Client updated log filters: {filters}')
+        logger.info('Client updated log filters: %s', filters)
     
     @socketio.on('request_log_history', namespace='/logs')
     def on_request_log_history(data):
@@ -226,7 +226,7 @@ def setup_websocket_handlers(socketio):
     @socketio.on_error_default
     def default_error_handler(e):
         """Handle WebSocket errors."""
-        logger.error(f'WebSocket error: {e}')
+        logger.error('WebSocket error: %s', e)
         emit('error', {
             'message': 'An error occurred',
             'timestamp': datetime.utcnow().isoformat()
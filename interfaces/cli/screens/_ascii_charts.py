@@ -0,0 +1,141 @@
+"""
+ASCII Charts
+
+Pure rendering functions for the ASCII line and bar charts drawn by the
+metrics and monitoring screens. Nothing here touches a widget.
+"""
+
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Y-axis gutter used on rows that carry no threshold label
+BLANK_Y_LABEL = "     |"
+
+# Line charts with at most this many columns get index labels under the x-axis
+INDEX_LABEL_LIMIT = 24
+
+
+class ChartFrame(NamedTuple):
+    """Parts of a line chart that depend only on its width and height."""
+    x_axis: str
+    index_labels: Optional[str]
+    labeled_rows: Tuple[bool, ...]
+
+
+@lru_cache(maxsize=8)
+def _separator(width: int) -> str:
+    """Build the separator line drawn under a chart's title."""
+    return "-" * width
+
+
+@lru_cache(maxsize=32)
+def chart_frame(width: int, height: int) -> ChartFrame:
+    """
+    Build the data-independent parts of a width x height line chart.
+
+    labeled_rows flags, top row first, the rows whose y-axis shows the
+    threshold value: the top, middle and bottom rows. index_labels is None
+    when the chart is too wide to label every few columns.
+    """
+    index_labels = None
+    if width <= INDEX_LABEL_LIMIT:
+        every = max(1, width // 6)  # Show ~6 labels
+        index_labels = "     " + "".join(f"{i:2d}" if i % every == 0 else "  " for i in range(width))
+
+    return ChartFrame(
+        x_axis="     " + "-" * width,
+        index_labels=index_labels,
+        labeled_rows=tuple(i in (height, height // 2, 1) for i in range(height, 0, -1)),
+    )
+
+
+def rasterize_columns(values: Sequence[float], min_value: float, range_value: float,
+                      height: int) -> Tuple[np.ndarray, List[str]]:
+    """
+    Rasterize values into chart rows, top row first.
+
+    A cell is filled when its column value reaches the row threshold. The
+    whole grid is produced by one broadcast comparison instead of a Python
+    loop per cell. Returns the row thresholds alongside the rendered rows.
+    """
+    data = np.asarray(values, dtype=np.float64)
+    thresholds = min_value + range_value * np.arange(height, 0, -1, dtype=np.float64) / height
+    cells = np.where(data[None, :] >= thresholds[:, None], "█", " ")
+    return thresholds, ["".join(row) for row in cells]
+
+
+def line_chart(title: str, data: Sequence[float], width: int = 60, height: int = 15,
+               unit: str = "", x_label: Optional[str] = None,
+               separator_width: Optional[int] = None) -> str:
+    """
+    Render data as an ASCII line chart.
+
+    Data longer than width is sampled down to evenly spaced points. x_label,
+    when given, replaces the index labels under the x-axis. separator_width
+    sets the width of the separator line and defaults to the chart width.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    if data.size == 0:
+        return "No data available"
+
+    # Find min/max values
+    max_value = float(data.max())
+    min_value = float(data.min())
+    range_value = max(max_value - min_value, 1)  # Avoid division by zero
+
+    # Select evenly distributed points if we have too many
+    chart_width = min(width, data.size)
+    if data.size > chart_width:
+        step = data.size / chart_width
+        data = data[(np.arange(chart_width) * step).astype(np.intp)]
+
+    frame = chart_frame(chart_width, height)
+    ascii_chart = [
+        title,
+        f"Max: {max_value:.1f}{unit} | Min: {min_value:.1f}{unit}",
+        _separator(chart_width if separator_width is None else separator_width),
+    ]
+
+    # Generate chart rows, labelling the y-axis on the top, middle and bottom rows
+    thresholds, rows = rasterize_columns(data, min_value, range_value, height)
+    for labeled, threshold, row in zip(frame.labeled_rows, thresholds, rows):
+        y_label = f"{threshold:4.1f} |" if labeled else BLANK_Y_LABEL
+        ascii_chart.append(f"{y_label} {row}")
+
+    # Add x-axis and its labels
+    ascii_chart.append(frame.x_axis)
+    if x_label is not None:
+        ascii_chart.append("     " + x_label)
+    elif frame.index_labels is not None:
+        ascii_chart.append(frame.index_labels)
+
+    return "\n".join(ascii_chart)
+
+
+def bar_chart(title: str, labels: Sequence[str], values: Sequence[int],
+              width: int = 60, height: int = 15) -> str:
+    """Render labelled integer values as an ASCII bar chart."""
+    if not values or not labels:
+        return "No data available"
+
+    # Calculate bar heights, scaled to the largest value
+    max_value = max(values)
+    bar_heights = [min(height, int((value / max_value) * height)) for value in values]
+
+    ascii_chart = [title, _separator(width)]
+
+    # Generate chart rows from top to bottom
+    for h in range(height, 0, -1):
+        ascii_chart.append("".join(
+            ["     |", *("█ " if bar_height >= h else "  " for bar_height in bar_heights)]
+        ))
+
+    # Add x-axis, labels truncated to 2 chars, and values
+    ascii_chart.append("     +" + "-" * (len(values) * 2 + 1))
+    ascii_chart.append("      " + "".join(f"{label[:2]} " for label in labels))
+    ascii_chart.append("      " + "".join(f"{value:2d} " for value in values))
+
+    return "\n".join(ascii_chart)
\ No newline at end of file
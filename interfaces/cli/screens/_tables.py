@@ -0,0 +1,39 @@
+"""
+DataTable Helpers
+
+Shared helpers for keeping screen DataTables in sync with their data
+without clearing and rebuilding them on every refresh tick.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+from textual.widgets import DataTable
+
+
+def sync_table_rows(table: DataTable, rows: Iterable[Tuple], last_rows: Dict[str, Tuple]) -> None:
+    """
+    Bring a table in line with rows keyed by their first column.
+
+    New rows are added, vanished rows are removed, and existing rows only have
+    the cells that actually changed updated. last_rows holds the previously
+    written rows and is updated in place.
+    """
+    seen = set()
+
+    for row in rows:
+        row_key = row[0]
+        seen.add(row_key)
+        previous = last_rows.get(row_key)
+
+        if previous is None:
+            table.add_row(*row, key=row_key)
+        elif previous != row:
+            for column, (old_value, new_value) in zip(table.ordered_columns, zip(previous, row)):
+                if old_value != new_value:
+                    table.update_cell(row_key, column.key, new_value)
+
+        last_rows[row_key] = row
+
+    for row_key in [key for key in last_rows if key not in seen]:
+        table.remove_row(row_key)
+        del last_rows[row_key]
@@ -0,0 +1,45 @@
+"""
+Widget Lookup Helpers
+
+Shared helpers for screens that refresh the same widgets on every tick,
+resolving each widget once and skipping updates that would not change it.
+"""
+
+from textual.widget import Widget
+
+
+class LiveWidgetsMixin:
+    """
+    Cached widget lookups and change-only Static updates for a screen.
+
+    LIVE_WIDGET_IDS lists the widgets touched on every refresh tick; call
+    resolve_live_widgets from on_mount to look them up once. Widgets mounted
+    later are resolved by get_widget on first use.
+    """
+
+    LIVE_WIDGET_IDS: tuple[str, ...] = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._widgets: dict[str, Widget] = {}
+        self._static_texts: dict[str, str] = {}
+
+    def resolve_live_widgets(self) -> None:
+        """Look up every widget in LIVE_WIDGET_IDS."""
+        self._widgets.update(
+            (widget_id, self.query_one(f"#{widget_id}")) for widget_id in self.LIVE_WIDGET_IDS
+        )
+
+    def get_widget(self, widget_id: str):
+        """Return a widget by id, resolving the selector only on first use."""
+        widget = self._widgets.get(widget_id)
+        if widget is None:
+            widget = self._widgets[widget_id] = self.query_one(f"#{widget_id}")
+        return widget
+
+    def update_static(self, widget_id: str, text: str) -> None:
+        """Update a Static's content, skipping the call when the text is unchanged."""
+        if self._static_texts.get(widget_id) == text:
+            return
+        self.get_widget(widget_id).update(text)
+        self._static_texts[widget_id] = text
@@ -14,10 +14,24 @@ from textual.validation import Number
 from textual.screen import Screen
 
 
+def labeled_field(label: str, field) -> Horizontal:
+    """Build an input-group row with a right-aligned label next to a form field."""
+    return Horizontal(
+        Static(label, classes="input-label"),
+        field,
+        classes="input-group"
+    )
+
+
+def labeled_input(label: str, **input_kwargs) -> Horizontal:
+    """Build an input-group row holding a labeled Input field."""
+    return labeled_field(label, Input(classes="input-field", **input_kwargs))
+
+
 class ConfigurationScreen(Container):
     """Configuration screen for setting up simulations."""
     
-    CSS = """
+    DEFAULT_CSS = """
     .config-section {
         border: round $primary;
         margin: 1;
@@ -42,7 +56,7 @@ class ConfigurationScreen(Container):
     }
     
     .input-field {
-        flex: 1;
+        width: 1fr;
     }
     
     .button-group {
@@ -68,25 +82,21 @@ class ConfigurationScreen(Container):
                     with Container(classes="config-section"):
                         yield Static("📝 Basic Configuration", classes="config-title")
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Simulation Name:", classes="input-label")
-                            yield Input(
-                                placeholder="e.g., Petstore API Test",
-                                id="api-sim-name",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Simulation Name:",
+                            placeholder="e.g., Petstore API Test",
+                            id="api-sim-name"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("API Source:", classes="input-label")
-                            yield Input(
-                                placeholder="Swagger URL or file path",
-                                id="api-source",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "API Source:",
+                            placeholder="Swagger URL or file path",
+                            id="api-source"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Environment:", classes="input-label")
-                            yield Select(
+                        yield labeled_field(
+                            "Environment:",
+                            Select(
                                 options=[
                                     ("dev", "Development"),
                                     ("staging", "Staging"),
@@ -95,37 +105,32 @@ class ConfigurationScreen(Container):
                                 id="api-environment",
                                 classes="input-field"
                             )
+                        )
                     
                     # Load Configuration
                     with Container(classes="config-section"):
                         yield Static("⚡ Load Configuration", classes="config-title")
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Total Requests:", classes="input-label")
-                            yield Input(
-                                placeholder="1000",
-                                validators=[Number(minimum=1, maximum=1000000)],
-                                id="api-total-requests",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Total Requests:",
+                            placeholder="1000",
+                            validators=[Number(minimum=1, maximum=1000000)],
+                            id="api-total-requests"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Concurrent Threads:", classes="input-label")
-                            yield Input(
-                                placeholder="5",
-                                validators=[Number(minimum=1, maximum=50)],
-                                id="api-threads",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Concurrent Threads:",
+                            placeholder="5",
+                            validators=[Number(minimum=1, maximum=50)],
+                            id="api-threads"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Request Delay (ms):", classes="input-label")
-                            yield Input(
-                                placeholder="0",
-                                validators=[Number(minimum=0, maximum=10000)],
-                                id="api-delay",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Request Delay (ms):",
+                            placeholder="0",
+                            validators=[Number(minimum=0, maximum=10000)],
+                            id="api-delay"
+                        )
                     
                     # Authentication Configuration
                     with Container(classes="config-section"):
@@ -162,17 +167,15 @@ class ConfigurationScreen(Container):
                     with Container(classes="config-section"):
                         yield Static("🗄️ Database Connection", classes="config-title")
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Simulation Name:", classes="input-label")
-                            yield Input(
-                                placeholder="e.g., User Database Ingestion",
-                                id="db-sim-name",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Simulation Name:",
+                            placeholder="e.g., User Database Ingestion",
+                            id="db-sim-name"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Database Type:", classes="input-label")
-                            yield Select(
+                        yield labeled_field(
+                            "Database Type:",
+                            Select(
                                 options=[
                                     ("postgresql", "PostgreSQL"),
                                     ("mysql", "MySQL"),
@@ -182,69 +185,56 @@ class ConfigurationScreen(Container):
                                 id="db-type",
                                 classes="input-field"
                             )
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Host:", classes="input-label")
-                            yield Input(
-                                placeholder="localhost",
-                                id="db-host",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Host:",
+                            placeholder="localhost",
+                            id="db-host"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Port:", classes="input-label")
-                            yield Input(
-                                placeholder="5432",
-                                validators=[Number(minimum=1, maximum=65535)],
-                                id="db-port",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Port:",
+                            placeholder="5432",
+                            validators=[Number(minimum=1, maximum=65535)],
+                            id="db-port"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Database Name:", classes="input-label")
-                            yield Input(
-                                placeholder="myapp_db",
-                                id="db-name",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Database Name:",
+                            placeholder="myapp_db",
+                            id="db-name"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Username:", classes="input-label")
-                            yield Input(
-                                placeholder="username",
-                                id="db-username",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Username:",
+                            placeholder="username",
+                            id="db-username"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Password:", classes="input-label")
-                            yield Input(
-                                placeholder="password",
-                                password=True,
-                                id="db-password",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Password:",
+                            placeholder="password",
+                            password=True,
+                            id="db-password"
+                        )
                     
                     # Data Generation Settings
                     with Container(classes="config-section"):
                         yield Static("📊 Data Generation", classes="config-title")
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Records per Table:", classes="input-label")
-                            yield Input(
-                                placeholder="1000",
-                                validators=[Number(minimum=1, maximum=1000000)],
-                                id="db-records",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Records per Table:",
+                            placeholder="1000",
+                            validators=[Number(minimum=1, maximum=1000000)],
+                            id="db-records"
+                        )
                         
-                        with Horizontal(classes="input-group"):
-                            yield Static("Target Schema:", classes="input-label")
-                            yield Input(
-                                placeholder="public (leave empty for all schemas)",
-                                id="db-schema",
-                                classes="input-field"
-                            )
+                        yield labeled_input(
+                            "Target Schema:",
+                            placeholder="public (leave empty for all schemas)",
+                            id="db-schema"
+                        )
                         
                         with Horizontal(classes="input-group"):
                             yield Checkbox("Preserve existing data", id="db-preserve-data")
@@ -13,10 +13,26 @@ import time
 from datetime import datetime
 
 
+# Sample data shown until the dashboard is wired to live simulations.
+# Rows are plain tuples so they can be hashed and passed straight to add_row.
+SAMPLE_ACTIVE_SIMULATIONS = (
+    ("sim_001", "API", "Running", "75%", "45.2", "14:30:15"),
+    ("sim_002", "Database", "Running", "32%", "12.8", "15:45:30"),
+)
+
+SAMPLE_RECENT_ACTIVITIES = (
+    ("16:23:45", "API", "Started", "Success", "Petstore simulation"),
+    ("16:20:12", "API", "Completed", "Success", "User API test - 1000 requests"),
+    ("16:15:30", "Database", "Started", "Running", "PostgreSQL ingestion"),
+    ("16:10:08", "API", "Failed", "Error", "Auth token expired"),
+    ("16:05:22", "System", "Started", "Success", "Fake Sphere CLI"),
+)
+
+
 class DashboardScreen(Container):
     """Dashboard screen showing simulation overview."""
     
-    CSS = """
+    DEFAULT_CSS = """
     .dashboard-section {
         border: round $primary;
         margin: 1;
@@ -78,6 +94,11 @@ class DashboardScreen(Container):
                 yield Static("📝 Recent Activity", classes="dashboard-title")
                 yield DataTable(id="recent-activity-table")
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Last rows written to each table, used to skip no-op rebuilds
+        self._last_table_rows: dict[str, tuple] = {}
+    
     def on_mount(self) -> None:
         """Initialize dashboard when mounted."""
         self.setup_tables()
@@ -109,30 +130,17 @@ class DashboardScreen(Container):
         self.query_one("#uptime").update("⏱️ Uptime: 2d 14h 32m")
         
         # Update active simulations table
-        active_table = self.query_one("#active-simulations-table")
-        active_table.clear()
-        
-        # Sample active simulations
-        active_simulations = [
-            ("sim_001", "API", "Running", "75%", "45.2", "14:30:15"),
-            ("sim_002", "Database", "Running", "32%", "12.8", "15:45:30"),
-        ]
-        
-        for sim in active_simulations:
-            active_table.add_row(*sim)
+        self.update_table("#active-simulations-table", SAMPLE_ACTIVE_SIMULATIONS)
         
         # Update recent activity table
-        recent_table = self.query_one("#recent-activity-table")
-        recent_table.clear()
-        
-        # Sample recent activities
-        recent_activities = [
-            ("16:23:45", "API", "Started", "Success", "Petstore simulation"),
-            ("16:20:12", "API", "Completed", "Success", "User API test - 1000 requests"),
-            ("16:15:30", "Database", "Started", "Running", "PostgreSQL ingestion"),
-            ("16:10:08", "API", "Failed", "Error", "Auth token expired"),
-            ("16:05:22", "System", "Started", "Success", "Fake Sphere CLI"),
-        ]
+        self.update_table("#recent-activity-table", SAMPLE_RECENT_ACTIVITIES)
+    
+    def update_table(self, selector: str, rows: tuple) -> None:
+        """Replace a table's rows, skipping the rebuild when nothing changed."""
+        if self._last_table_rows.get(selector) == rows:
+            return
+        self._last_table_rows[selector] = rows
         
-        for activity in recent_activities:
-            recent_table.add_row(*activity)
\ No newline at end of file
+        table = self.query_one(selector)
+        table.clear()
+        table.add_rows(rows)
\ No newline at end of file
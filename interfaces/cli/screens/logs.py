@@ -5,18 +5,59 @@ Real-time log viewing with filtering, search capabilities,
 and log level management.
 """
 
-from textual.widgets import Static, Input, Button, Select, Log, Checkbox
+from textual.widgets import Static, Input, Button, Select, RichLog, Checkbox
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
 from textual.validation import Length
+from rich.text import Text
+from collections import deque
+from typing import NamedTuple, Optional
+import re
 import time
 from datetime import datetime
 
 
+# Maximum number of log records kept in memory for re-filtering
+LOG_HISTORY_LIMIT = 10_000
+
+# Pre-styled level labels, built once so log lines never go through the markup parser
+LEVEL_TEXTS = {
+    "DEBUG": Text("DEBUG", style="dim white"),
+    "INFO": Text("INFO", style="cyan"),
+    "SUCCESS": Text("SUCCESS", style="green"),
+    "WARNING": Text("WARNING", style="yellow"),
+    "ERROR": Text("ERROR", style="red"),
+    "SYSTEM": Text("SYSTEM", style="yellow"),
+}
+
+
+class LogRecord(NamedTuple):
+    """A single log line. Tuple-backed so history entries carry no per-instance dict."""
+    timestamp: str
+    level: str
+    simulation: str
+    plain: str
+    rendered: Text
+
+
+def make_log_record(level: str, simulation: str, message: str) -> LogRecord:
+    """Build a log record with both plain and styled forms."""
+    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    return LogRecord(
+        timestamp=timestamp,
+        level=level,
+        simulation=simulation,
+        plain=f"{timestamp} {level} [{simulation}] {message}",
+        rendered=Text.assemble(
+            (timestamp, "dim"), " ", LEVEL_TEXTS[level], f" [{simulation}] {message}"
+        ),
+    )
+
+
 class LogsScreen(Container):
     """Real-time logs viewing screen."""
     
-    CSS = """
+    DEFAULT_CSS = """
     .logs-section {
         border: round $primary;
         margin: 1;
@@ -130,13 +171,17 @@ class LogsScreen(Container):
             # Log Viewer
             with Container(classes="logs-section"):
                 yield Static("📝 Live Logs", classes="logs-title")
-                yield Log(
+                yield RichLog(
                     id="log-viewer",
                     classes="log-viewer",
-                    auto_scroll=True,
-                    markup=True
+                    auto_scroll=True
                 )
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.log_history: deque[LogRecord] = deque(maxlen=LOG_HISTORY_LIMIT)
+        self._search_pattern: Optional[re.Pattern] = None
+    
     def on_mount(self) -> None:
         """Initialize logs screen."""
         self.setup_log_viewer()
@@ -150,69 +195,72 @@ class LogsScreen(Container):
         
         # Add some initial log entries
         initial_logs = [
-            ("[cyan]INFO[/cyan]", "System", "Fake Sphere CLI started successfully"),
-            ("[green]SUCCESS[/green]", "sim_001", "API simulation initialized"),
-            ("[cyan]INFO[/cyan]", "sim_001", "Loaded Swagger specification from petstore.swagger.io"),
-            ("[yellow]WARNING[/yellow]", "sim_002", "Database connection pool at 80% capacity"),
-            ("[cyan]INFO[/cyan]", "sim_001", "Authentication: Bearer token acquired"),
-            ("[green]SUCCESS[/green]", "sim_001", "Request completed: GET /api/pets - 200 OK"),
+            ("INFO", "System", "Fake Sphere CLI started successfully"),
+            ("SUCCESS", "sim_001", "API simulation initialized"),
+            ("INFO", "sim_001", "Loaded Swagger specification from petstore.swagger.io"),
+            ("WARNING", "sim_002", "Database connection pool at 80% capacity"),
+            ("INFO", "sim_001", "Authentication: Bearer token acquired"),
+            ("SUCCESS", "sim_001", "Request completed: GET /api/pets - 200 OK"),
         ]
         
         for level, simulation, message in initial_logs:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            log_entry = f"[dim]{timestamp}[/dim] {level} [{simulation}] {message}"
-            log_viewer.write_line(log_entry)
+            record = make_log_record(level, simulation, message)
+            self.log_history.append(record)
+            log_viewer.write(record.rendered)
     
     def add_sample_log(self) -> None:
         """Add sample log entries to simulate real-time logging."""
         import random
         
         log_viewer = self.query_one("#log-viewer")
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
         
         # Sample log entries
         sample_logs = [
-            ("[cyan]INFO[/cyan]", "sim_001", "Request completed: GET /api/pets/123 - 200 OK (245ms)"),
-            ("[cyan]INFO[/cyan]", "sim_002", "Inserted 50 records into users table"),
-            ("[green]SUCCESS[/green]", "sim_001", "Authentication token refreshed"),
-            ("[yellow]WARNING[/yellow]", "sim_003", "Response time exceeding threshold: 1.2s"),
-            ("[cyan]INFO[/cyan]", "sim_001", "Request completed: POST /api/pets - 201 Created (189ms)"),
-            ("[dim white]DEBUG[/dim white]", "System", "Memory usage: 2.1GB / Thread pool: 5/10 active"),
-            ("[red]ERROR[/red]", "sim_003", "Request failed: GET /api/orders/456 - 404 Not Found"),
-            ("[cyan]INFO[/cyan]", "sim_002", "Processing table: product_categories (500/1000 records)"),
-            ("[green]SUCCESS[/green]", "sim_001", "Simulation milestone: 1000 requests completed"),
-            ("[yellow]WARNING[/yellow]", "sim_001", "Rate limit approaching: 95/100 requests per minute"),
+            ("INFO", "sim_001", "Request completed: GET /api/pets/123 - 200 OK (245ms)"),
+            ("INFO", "sim_002", "Inserted 50 records into users table"),
+            ("SUCCESS", "sim_001", "Authentication token refreshed"),
+            ("WARNING", "sim_003", "Response time exceeding threshold: 1.2s"),
+            ("INFO", "sim_001", "Request completed: POST /api/pets - 201 Created (189ms)"),
+            ("DEBUG", "System", "Memory usage: 2.1GB / Thread pool: 5/10 active"),
+            ("ERROR", "sim_003", "Request failed: GET /api/orders/456 - 404 Not Found"),
+            ("INFO", "sim_002", "Processing table: product_categories (500/1000 records)"),
+            ("SUCCESS", "sim_001", "Simulation milestone: 1000 requests completed"),
+            ("WARNING", "sim_001", "Rate limit approaching: 95/100 requests per minute"),
         ]
         
         # Randomly select and add a log entry
         level, simulation, message = random.choice(sample_logs)
-        log_entry = f"[dim]{timestamp}[/dim] {level} [{simulation}] {message}"
+        record = make_log_record(level, simulation, message)
+        self.log_history.append(record)
         
         # Apply filters
-        if self.should_show_log(log_entry, level, simulation):
-            log_viewer.write_line(log_entry)
+        if self.should_show_log(record):
+            log_viewer.write(record.rendered)
     
-    def should_show_log(self, log_entry: str, level: str, simulation: str) -> bool:
+    def should_show_log(self, record: LogRecord) -> bool:
         """Check if log entry should be shown based on current filters."""
         # Level filter
         level_filter = self.query_one("#log-level-filter").value
-        if level_filter != "ALL":
-            if level_filter not in log_entry:
-                return False
+        if level_filter != "ALL" and record.level != level_filter:
+            return False
         
         # Simulation filter
         sim_filter = self.query_one("#simulation-filter").value
-        if sim_filter != "ALL":
-            if sim_filter not in log_entry:
-                return False
+        if sim_filter != "ALL" and record.simulation != sim_filter:
+            return False
         
         # Text filter
-        search_text = self.query_one("#log-search").value
-        if search_text and search_text.lower() not in log_entry.lower():
+        if self._search_pattern and not self._search_pattern.search(record.plain):
             return False
         
         return True
     
+    def watch_filter_text(self, filter_text: str) -> None:
+        """Compile the search filter once per change instead of once per log line."""
+        self._search_pattern = (
+            re.compile(re.escape(filter_text), re.IGNORECASE) if filter_text else None
+        )
+    
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle filter input changes."""
         if event.input.id == "log-search":
@@ -247,25 +295,34 @@ class LogsScreen(Container):
     
     def refresh_logs(self) -> None:
         """Refresh log display based on current filters."""
-        # In a real implementation, this would re-filter the log history
-        # For now, just clear and restart with filtered view
-        pass
+        log_viewer = self.query_one("#log-viewer")
+        log_viewer.clear()
+        
+        for record in self.log_history:
+            if self.should_show_log(record):
+                log_viewer.write(record.rendered)
     
     def clear_logs(self) -> None:
         """Clear the log viewer."""
         log_viewer = self.query_one("#log-viewer")
         log_viewer.clear()
+        self.log_history.clear()
         
         # Add a cleared notification
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_viewer.write_line(f"[dim]{timestamp}[/dim] [yellow]SYSTEM[/yellow] [System] Log viewer cleared by user")
+        record = make_log_record("SYSTEM", "System", "Log viewer cleared by user")
+        self.log_history.append(record)
+        log_viewer.write(record.rendered)
     
     def export_logs(self) -> None:
         """Export logs to file."""
         # TODO: Implement log export functionality
         log_viewer = self.query_one("#log-viewer")
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_viewer.write_line(f"[dim]{timestamp}[/dim] [green]SUCCESS[/green] [System] Logs exported to logs_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+        record = make_log_record(
+            "SUCCESS", "System",
+            f"Logs exported to logs_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        )
+        self.log_history.append(record)
+        log_viewer.write(record.rendered)
     
     def toggle_log_updates(self) -> None:
         """Pause or resume log updates."""
@@ -8,14 +8,36 @@ progress tracking, and control capabilities.
 from textual.widgets import Static, DataTable, ProgressBar, Button
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
+from collections import deque
+import asyncio
 import time
 import random
 
+import numpy as np
 
-class MonitoringScreen(Container):
+from ._ascii_charts import line_chart
+from ._tables import sync_table_rows
+from ._widgets import LiveWidgetsMixin
+
+
+# Number of rows kept in the live activity feed
+ACTIVITY_FEED_LIMIT = 10
+
+# Refresh cadence of the simulations table, in ticks of the 1 second timer
+MONITORING_REFRESH_TICKS = 2
+
+
+class MonitoringScreen(LiveWidgetsMixin, Container):
     """Real-time monitoring screen for active simulations."""
     
-    CSS = """
+    # Widgets touched on every refresh tick
+    LIVE_WIDGET_IDS = (
+        "monitoring-table", "activity-feed",
+        "current-requests", "requests-per-sec", "avg-response-time", "error-rate",
+        "simulation-progress", "progress-label", "realtime-chart",
+    )
+    
+    DEFAULT_CSS = """
     .monitor-section {
         border: round $primary;
         margin: 1;
@@ -33,7 +55,6 @@ class MonitoringScreen(Container):
     }
     
     .metric-display {
-        text-align: center;
         padding: 1;
         border: round $accent;
         margin: 0 1;
@@ -42,13 +63,16 @@ class MonitoringScreen(Container):
     .metric-value {
         text-style: bold;
         color: $accent;
-        text-size: 2;
     }
     
     .metric-label {
         color: $text-muted;
     }
     
+    .metric-value, .metric-label {
+        text-align: center;
+    }
+    
     .control-button {
         margin: 0 1;
     }
@@ -119,14 +143,30 @@ class MonitoringScreen(Container):
                 yield Static("📡 Live Activity Feed", classes="monitor-title")
                 yield DataTable(id="activity-feed")
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._simulation_rows: dict[str, tuple] = {}
+        self._activity_keys: deque = deque()
+        self._tick_count = 0
+        self._rng = np.random.default_rng()
+    
     def on_mount(self) -> None:
         """Initialize monitoring screen."""
+        self.resolve_live_widgets()
         self.setup_tables()
         self.update_monitoring_data()
         
         # Set up real-time updates
-        self.set_interval(2.0, self.update_monitoring_data)
-        self.set_interval(1.0, self.update_live_metrics)
+        self.set_interval(1.0, self.refresh_tick)
+    
+    async def refresh_tick(self) -> None:
+        """Run the periodic refreshes that are due on this tick."""
+        self._tick_count += 1
+        
+        if self._tick_count % MONITORING_REFRESH_TICKS == 0:
+            self.update_monitoring_data()
+        
+        await self.update_live_metrics()
     
     def setup_tables(self) -> None:
         """Set up monitoring tables."""
@@ -142,9 +182,6 @@ class MonitoringScreen(Container):
     
     def update_monitoring_data(self) -> None:
         """Update monitoring table with current simulations."""
-        monitoring_table = self.query_one("#monitoring-table")
-        monitoring_table.clear()
-        
         # Sample active simulations
         simulations = [
             ("sim_001", "Petstore API", "API", "Running", "75%", "45.2", "2", "00:14:32", "⏸️ ⏹️"),
@@ -152,12 +189,6 @@ class MonitoringScreen(Container):
             ("sim_003", "Orders API", "API", "Paused", "60%", "0.0", "5", "00:22:45", "▶️ ⏹️"),
         ]
         
-        for sim in simulations:
-            monitoring_table.add_row(*sim)
-        
-        # Update activity feed
-        activity_table = self.query_one("#activity-feed")
-        
         # Add new activity (simulate real-time updates)
         current_time = time.strftime("%H:%M:%S")
         activities = [
@@ -166,15 +197,16 @@ class MonitoringScreen(Container):
             (current_time, "sim_001", "Authentication", "Bearer token refreshed"),
         ]
         
-        for activity in activities:
-            activity_table.add_row(*activity)
-        
-        # Keep only last 10 activities
-        if activity_table.row_count > 10:
-            while activity_table.row_count > 10:
-                activity_table.remove_row(0)
+        with self.app.batch_update():
+            sync_table_rows(self.get_widget("monitoring-table"), simulations, self._simulation_rows)
+            
+            # Append the new activities in one call, then drop the oldest rows over the limit
+            activity_table = self.get_widget("activity-feed")
+            self._activity_keys.extend(activity_table.add_rows(activities))
+            while len(self._activity_keys) > ACTIVITY_FEED_LIMIT:
+                activity_table.remove_row(self._activity_keys.popleft())
     
-    def update_live_metrics(self) -> None:
+    async def update_live_metrics(self) -> None:
         """Update live metrics for selected simulation."""
         # Simulate real-time metrics
         current_requests = random.randint(1500, 2000)
@@ -183,64 +215,40 @@ class MonitoringScreen(Container):
         error_rate = round(random.uniform(0, 5), 1)
         progress = min(100, random.randint(70, 85))
         
-        # Update metric displays
-        self.query_one("#current-requests").update(str(current_requests))
-        self.query_one("#requests-per-sec").update(str(rps))
-        self.query_one("#avg-response-time").update(f"{response_time}ms")
-        self.query_one("#error-rate").update(f"{error_rate}%")
-        
-        # Update progress bar
-        progress_bar = self.query_one("#simulation-progress")
-        progress_bar.progress = progress
-        
-        # Update progress label
-        self.query_one("#progress-label").update(f"Progress: {progress}% ({current_requests}/2000)")
-        
-        # Update chart with ASCII visualization
-        chart = self.query_one("#realtime-chart")
-        
-        # Generate sample data for the chart
-        data_points = 20  # Show 20 data points
-        y_data = [random.uniform(35, 55) for _ in range(data_points)]  # RPS data
-        
-        # Create a simple ASCII chart
-        max_value = max(y_data)
-        min_value = min(y_data)
-        range_value = max(max_value - min_value, 1)  # Avoid division by zero
+        # Build the chart text off the event loop before touching any widget
+        chart_text = await asyncio.to_thread(self.render_realtime_chart)
         
-        chart_height = 10
-        ascii_chart = []
-        
-        # Add title
-        ascii_chart.append("Real-time Request Rate")
-        ascii_chart.append(f"Max: {max_value:.1f} RPS | Min: {min_value:.1f} RPS")
-        ascii_chart.append("-" * 50)
-        
-        # Generate chart rows
-        for i in range(chart_height, 0, -1):
-            row = []
-            threshold = min_value + (range_value * i / chart_height)
+        # Apply every widget change in one batch so the screen repaints once
+        with self.app.batch_update():
+            # Update metric displays
+            self.update_static("current-requests", str(current_requests))
+            self.update_static("requests-per-sec", str(rps))
+            self.update_static("avg-response-time", f"{response_time}ms")
+            self.update_static("error-rate", f"{error_rate}%")
             
-            for value in y_data:
-                if value >= threshold:
-                    row.append("█")
-                else:
-                    row.append(" ")
+            # Update progress bar
+            self.get_widget("simulation-progress").update(progress=progress)
             
-            # Add y-axis label every few rows
-            if i == chart_height or i == 1 or i == chart_height // 2:
-                y_label = f"{threshold:4.1f} |"
-            else:
-                y_label = "     |"
-                
-            ascii_chart.append(f"{y_label} {''.join(row)}")
-        
-        # Add x-axis
-        ascii_chart.append("     " + "-" * data_points)
-        ascii_chart.append("     " + "Time (seconds ago)")
+            # Update progress label
+            self.update_static("progress-label", f"Progress: {progress}% ({current_requests}/2000)")
+            
+            self.update_static("realtime-chart", chart_text)
+    
+    def render_realtime_chart(self) -> str:
+        """Generate sample request-rate data and render it as an ASCII chart."""
+        # Generate sample data for the chart
+        data_points = 20  # Show 20 data points
+        y_data = self._rng.uniform(35, 55, size=data_points)  # RPS data
         
-        # Update the chart widget with ASCII visualization
-        chart.update("\n".join(ascii_chart))
+        return line_chart(
+            title="Real-time Request Rate",
+            data=y_data,
+            width=data_points,
+            height=10,
+            unit=" RPS",
+            x_label="Time (seconds ago)",
+            separator_width=50
+        )
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle monitoring control buttons."""
@@ -9,19 +9,27 @@ This module collects and manages comprehensive metrics during API simulation inc
 - Real-time metrics aggregation
 """
 
-import json
+import heapq
+import math
 import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Any, Iterable, Optional, Tuple
+from dataclasses import dataclass, asdict, field, replace
 from threading import Lock
 import os
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class RequestMetric:
-    """Individual request metric data."""
-    timestamp: str
+    """
+    Individual request metric data.
+    
+    The ISO timestamp is derived from request_start_time when metrics are
+    exported, keeping datetime formatting out of the recording path.
+    """
     simulation_id: str
     endpoint_path: str
     http_method: str
@@ -40,7 +48,7 @@ class RequestMetric:
     request_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationSummary:
     """Summary statistics for a simulation."""
     simulation_id: str
@@ -58,17 +66,157 @@ class SimulationSummary:
     endpoint_statistics: Dict[str, Dict[str, Any]]
 
 
+@dataclass(slots=True)
+class _ResponseTimeStats:
+    """Running count, sum, min and max of response times."""
+    count: int = 0
+    total_ms: float = 0.0
+    min_ms: float = math.inf
+    max_ms: float = -math.inf
+    
+    def add(self, response_time_ms: float) -> None:
+        """Fold one response time into the running values."""
+        self.count += 1
+        self.total_ms += response_time_ms
+        if response_time_ms < self.min_ms:
+            self.min_ms = response_time_ms
+        if response_time_ms > self.max_ms:
+            self.max_ms = response_time_ms
+
+
+@dataclass(slots=True)
+class _EndpointStats:
+    """Running request counts and response times for one endpoint."""
+    total_requests: int = 0
+    successful_requests: int = 0
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    response_times: _ResponseTimeStats = field(default_factory=_ResponseTimeStats)
+    
+    def add(self, status_code: int, response_time_ms: float) -> None:
+        """Fold one request into the running values."""
+        self.total_requests += 1
+        if 200 <= status_code < 300:
+            self.successful_requests += 1
+        self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+        self.response_times.add(response_time_ms)
+    
+    def copy(self) -> "_EndpointStats":
+        """Return an independent copy of the running values."""
+        return replace(self, status_codes=dict(self.status_codes), response_times=replace(self.response_times))
+
+
+@dataclass(slots=True)
+class _RunningAggregates:
+    """Aggregates updated by record_request so the getters never rescan the metrics."""
+    successful_requests: int = 0
+    response_times: _ResponseTimeStats = field(default_factory=_ResponseTimeStats)
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    endpoints: Dict[str, _EndpointStats] = field(default_factory=dict)
+    total_errors: int = 0
+    errors_by_status_code: Dict[str, int] = field(default_factory=dict)
+    errors_by_endpoint: Dict[str, int] = field(default_factory=dict)
+    error_messages: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def total_requests(self) -> int:
+        """Number of requests recorded."""
+        return self.response_times.count
+    
+    def add(self, endpoint_key: str, status_code: int, response_time_ms: float,
+            error_message: Optional[str]) -> None:
+        """Fold one request into the running values."""
+        if 200 <= status_code < 300:
+            self.successful_requests += 1
+        self.response_times.add(response_time_ms)
+        self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+        
+        endpoint = self.endpoints.get(endpoint_key)
+        if endpoint is None:
+            endpoint = self.endpoints[endpoint_key] = _EndpointStats()
+        endpoint.add(status_code, response_time_ms)
+        
+        if status_code >= 400 or error_message:
+            self.total_errors += 1
+            status_key = str(status_code)
+            self.errors_by_status_code[status_key] = self.errors_by_status_code.get(status_key, 0) + 1
+            self.errors_by_endpoint[endpoint_key] = self.errors_by_endpoint.get(endpoint_key, 0) + 1
+            if error_message:
+                self.error_messages[error_message] = self.error_messages.get(error_message, 0) + 1
+    
+    def copy(self) -> "_RunningAggregates":
+        """Return an independent copy of the running values."""
+        return replace(
+            self,
+            response_times=replace(self.response_times),
+            status_codes=dict(self.status_codes),
+            endpoints={key: endpoint.copy() for key, endpoint in self.endpoints.items()},
+            errors_by_status_code=dict(self.errors_by_status_code),
+            errors_by_endpoint=dict(self.errors_by_endpoint),
+            error_messages=dict(self.error_messages)
+        )
+
+
+def _endpoint_statistics(aggregates: _RunningAggregates) -> Dict[str, Dict[str, Any]]:
+    """Compute request counts, response times and error rate per endpoint."""
+    endpoint_stats = {}
+    
+    for endpoint_key, endpoint in aggregates.endpoints.items():
+        failed_requests = endpoint.total_requests - endpoint.successful_requests
+        response_times = endpoint.response_times
+        endpoint_stats[endpoint_key] = {
+            'total_requests': endpoint.total_requests,
+            'successful_requests': endpoint.successful_requests,
+            'failed_requests': failed_requests,
+            'status_codes': endpoint.status_codes,
+            'avg_response_time_ms': round(response_times.total_ms / response_times.count, 2),
+            'min_response_time_ms': round(response_times.min_ms, 2),
+            'max_response_time_ms': round(response_times.max_ms, 2),
+            'error_rate_percent': round(failed_requests / endpoint.total_requests * 100, 2)
+        }
+    
+    return endpoint_stats
+
+
+def _error_analysis(aggregates: _RunningAggregates) -> Dict[str, Any]:
+    """Group failed requests by status code, endpoint and error message."""
+    error_analysis = {
+        'total_errors': aggregates.total_errors,
+        'error_by_status_code': aggregates.errors_by_status_code,
+        'error_by_endpoint': aggregates.errors_by_endpoint,
+        'error_messages': aggregates.error_messages,
+        'common_errors': []
+    }
+    
+    # Identify most common errors
+    if error_analysis['error_messages']:
+        common_errors = heapq.nlargest(
+            5,  # Top 5 most common errors
+            error_analysis['error_messages'].items(),
+            key=lambda x: x[1]
+        )
+        error_analysis['common_errors'] = [
+            {'message': msg, 'count': count} for msg, count in common_errors
+        ]
+    
+    return error_analysis
+
+
 class MetricsCollector:
     """Collects and manages API simulation metrics."""
     
     def __init__(self, simulation_id: str, output_directory: str = None):
         self.simulation_id = simulation_id
         self.output_directory = output_directory or "./data/metrics"
-        self.metrics: List[RequestMetric] = []
+        self.metrics: Deque[RequestMetric] = deque()
+        # Guards the metrics and the running aggregates, which change together
         self.lock = Lock()
         self.simulation_start_time = time.time()
         self.simulation_end_time: Optional[float] = None
         
+        self._aggregates = _RunningAggregates()
+        # "METHOD /path" keys, built once per endpoint instead of once per request
+        self._endpoint_keys: Dict[Tuple[str, str], str] = {}
+        
         # Ensure output directory exists
         os.makedirs(self.output_directory, exist_ok=True)
     
@@ -106,10 +254,49 @@ class MetricsCollector:
             auth_type: Authentication type used
             request_id: Unique request identifier
         """
+        metric, endpoint_key = self._build_metric(
+            endpoint_path, http_method, target_host, target_port, request_url,
+            request_size_bytes, request_start_time, request_end_time, status_code,
+            response_size_bytes, response_message, error_message, auth_type, request_id
+        )
+        with self.lock:
+            self.metrics.append(metric)
+            self._aggregates.add(endpoint_key, status_code, metric.response_time_ms, error_message)
+    
+    def record_request_batch(self, requests: Iterable[Dict[str, Any]]) -> None:
+        """
+        Record metrics for several API requests at once.
+        
+        Each item holds the keyword arguments of record_request. The running
+        aggregates are updated under a single lock acquisition for the batch.
+        """
+        built = [self._build_metric(**request) for request in requests]
+        
+        with self.lock:
+            self.metrics.extend(metric for metric, _ in built)
+            add = self._aggregates.add
+            for metric, endpoint_key in built:
+                add(endpoint_key, metric.status_code, metric.response_time_ms, metric.error_message)
+    
+    def _build_metric(self,
+                      endpoint_path: str,
+                      http_method: str,
+                      target_host: str,
+                      target_port: int,
+                      request_url: str,
+                      request_size_bytes: int,
+                      request_start_time: float,
+                      request_end_time: float,
+                      status_code: int,
+                      response_size_bytes: int,
+                      response_message: str,
+                      error_message: Optional[str] = None,
+                      auth_type: Optional[str] = None,
+                      request_id: Optional[str] = None) -> Tuple[RequestMetric, str]:
+        """Build the metric for a request along with its endpoint key."""
         response_time_ms = (request_end_time - request_start_time) * 1000
         
         metric = RequestMetric(
-            timestamp=datetime.fromtimestamp(request_start_time, timezone.utc).isoformat(),
             simulation_id=self.simulation_id,
             endpoint_path=endpoint_path,
             http_method=http_method,
@@ -128,201 +315,144 @@ class MetricsCollector:
             request_id=request_id
         )
         
+        endpoint_key = self._endpoint_keys.get((http_method, endpoint_path))
+        if endpoint_key is None:
+            endpoint_key = self._endpoint_keys.setdefault(
+                (http_method, endpoint_path), f"{http_method} {endpoint_path}"
+            )
+        
+        return metric, endpoint_key
+    
+    def _compute_all(self) -> Tuple[SimulationSummary, Dict[int, int], Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Finish the simulation and compute every export section in one pass.
+        
+        Returns the summary, status code distribution, endpoint statistics and
+        error analysis, all taken under a single lock acquisition.
+        """
+        self.simulation_end_time = time.time()
+        
         with self.lock:
-            self.metrics.append(metric)
+            aggregates = self._aggregates.copy()
+        
+        endpoint_statistics = _endpoint_statistics(aggregates)
+        summary = self._summary(aggregates, endpoint_statistics)
+        return summary, aggregates.status_codes, endpoint_statistics, _error_analysis(aggregates)
     
     def get_current_statistics(self) -> Dict[str, Any]:
         """Get real-time statistics for current simulation."""
         with self.lock:
-            if not self.metrics:
-                return {
-                    'total_requests': 0,
-                    'successful_requests': 0,
-                    'failed_requests': 0,
-                    'avg_response_time_ms': 0,
-                    'requests_per_second': 0,
-                    'error_rate_percent': 0
-                }
-            
-            total_requests = len(self.metrics)
-            successful_requests = len([m for m in self.metrics if 200 <= m.status_code < 300])
-            failed_requests = total_requests - successful_requests
-            
-            response_times = [m.response_time_ms for m in self.metrics]
-            avg_response_time = sum(response_times) / len(response_times)
-            
-            elapsed_time = time.time() - self.simulation_start_time
-            requests_per_second = total_requests / elapsed_time if elapsed_time > 0 else 0
-            
-            error_rate = (failed_requests / total_requests * 100) if total_requests > 0 else 0
-            
+            successful_requests = self._aggregates.successful_requests
+            response_times = replace(self._aggregates.response_times)
+        
+        if response_times.count == 0:
             return {
-                'total_requests': total_requests,
-                'successful_requests': successful_requests,
-                'failed_requests': failed_requests,
-                'avg_response_time_ms': round(avg_response_time, 2),
-                'min_response_time_ms': round(min(response_times), 2),
-                'max_response_time_ms': round(max(response_times), 2),
-                'requests_per_second': round(requests_per_second, 2),
-                'error_rate_percent': round(error_rate, 2),
-                'elapsed_time_seconds': round(elapsed_time, 2)
+                'total_requests': 0,
+                'successful_requests': 0,
+                'failed_requests': 0,
+                'avg_response_time_ms': 0,
+                'requests_per_second': 0,
+                'error_rate_percent': 0
             }
+        
+        total_requests = response_times.count
+        failed_requests = total_requests - successful_requests
+        
+        elapsed_time = time.time() - self.simulation_start_time
+        requests_per_second = total_requests / elapsed_time if elapsed_time > 0 else 0
+        
+        error_rate = (failed_requests / total_requests * 100) if total_requests > 0 else 0
+        
+        return {
+            'total_requests': total_requests,
+            'successful_requests': successful_requests,
+            'failed_requests': failed_requests,
+            'avg_response_time_ms': round(response_times.total_ms / response_times.count, 2),
+            'min_response_time_ms': round(response_times.min_ms, 2),
+            'max_response_time_ms': round(response_times.max_ms, 2),
+            'requests_per_second': round(requests_per_second, 2),
+            'error_rate_percent': round(error_rate, 2),
+            'elapsed_time_seconds': round(elapsed_time, 2)
+        }
     
     def get_status_code_distribution(self) -> Dict[int, int]:
         """Get distribution of HTTP status codes."""
         with self.lock:
-            distribution = {}
-            for metric in self.metrics:
-                distribution[metric.status_code] = distribution.get(metric.status_code, 0) + 1
-            return distribution
+            return dict(self._aggregates.status_codes)
     
     def get_endpoint_statistics(self) -> Dict[str, Dict[str, Any]]:
         """Get per-endpoint statistics."""
         with self.lock:
-            endpoint_stats = {}
-            
-            for metric in self.metrics:
-                endpoint_key = f"{metric.http_method} {metric.endpoint_path}"
-                
-                if endpoint_key not in endpoint_stats:
-                    endpoint_stats[endpoint_key] = {
-                        'total_requests': 0,
-                        'successful_requests': 0,
-                        'failed_requests': 0,
-                        'response_times': [],
-                        'status_codes': {}
-                    }
-                
-                stats = endpoint_stats[endpoint_key]
-                stats['total_requests'] += 1
-                stats['response_times'].append(metric.response_time_ms)
-                
-                if 200 <= metric.status_code < 300:
-                    stats['successful_requests'] += 1
-                else:
-                    stats['failed_requests'] += 1
-                
-                stats['status_codes'][metric.status_code] = stats['status_codes'].get(metric.status_code, 0) + 1
-            
-            # Calculate derived statistics
-            for endpoint_key, stats in endpoint_stats.items():
-                response_times = stats['response_times']
-                if response_times:
-                    stats['avg_response_time_ms'] = round(sum(response_times) / len(response_times), 2)
-                    stats['min_response_time_ms'] = round(min(response_times), 2)
-                    stats['max_response_time_ms'] = round(max(response_times), 2)
-                else:
-                    stats['avg_response_time_ms'] = 0
-                    stats['min_response_time_ms'] = 0
-                    stats['max_response_time_ms'] = 0
-                
-                stats['error_rate_percent'] = round(
-                    (stats['failed_requests'] / stats['total_requests'] * 100) 
-                    if stats['total_requests'] > 0 else 0, 2
-                )
-                
-                # Remove raw response times from output to reduce size
-                del stats['response_times']
-            
-            return endpoint_stats
+            aggregates = self._aggregates.copy()
+        return _endpoint_statistics(aggregates)
     
     def get_error_analysis(self) -> Dict[str, Any]:
         """Analyze errors and failure patterns."""
         with self.lock:
-            error_analysis = {
-                'total_errors': 0,
-                'error_by_status_code': {},
-                'error_by_endpoint': {},
-                'error_messages': {},
-                'common_errors': []
-            }
-            
-            for metric in self.metrics:
-                if metric.status_code >= 400 or metric.error_message:
-                    error_analysis['total_errors'] += 1
-                    
-                    # Group by status code
-                    status_key = str(metric.status_code)
-                    error_analysis['error_by_status_code'][status_key] = \
-                        error_analysis['error_by_status_code'].get(status_key, 0) + 1
-                    
-                    # Group by endpoint
-                    endpoint_key = f"{metric.http_method} {metric.endpoint_path}"
-                    error_analysis['error_by_endpoint'][endpoint_key] = \
-                        error_analysis['error_by_endpoint'].get(endpoint_key, 0) + 1
-                    
-                    # Track error messages
-                    if metric.error_message:
-                        error_analysis['error_messages'][metric.error_message] = \
-                            error_analysis['error_messages'].get(metric.error_message, 0) + 1
-            
-            # Identify most common errors
-            if error_analysis['error_messages']:
-                common_errors = sorted(
-                    error_analysis['error_messages'].items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )[:5]  # Top 5 most common errors
-                error_analysis['common_errors'] = [
-                    {'message': msg, 'count': count} for msg, count in common_errors
-                ]
-            
-            return error_analysis
+            aggregates = self._aggregates.copy()
+        return _error_analysis(aggregates)
     
     def finish_simulation(self) -> SimulationSummary:
         """Mark simulation as finished and generate final summary."""
-        self.simulation_end_time = time.time()
+        summary, _, _, _ = self._compute_all()
+        return summary
+    
+    def _summary(self, aggregates: _RunningAggregates,
+                 endpoint_statistics: Dict[str, Dict[str, Any]]) -> SimulationSummary:
+        """Build the final simulation summary from a copy of the running aggregates."""
+        start_time = datetime.fromtimestamp(self.simulation_start_time, timezone.utc).isoformat()
+        end_time = datetime.fromtimestamp(self.simulation_end_time, timezone.utc).isoformat()
         
-        with self.lock:
-            if not self.metrics:
-                return SimulationSummary(
-                    simulation_id=self.simulation_id,
-                    start_time=datetime.fromtimestamp(self.simulation_start_time, timezone.utc).isoformat(),
-                    end_time=datetime.fromtimestamp(self.simulation_end_time, timezone.utc).isoformat(),
-                    total_requests=0,
-                    successful_requests=0,
-                    failed_requests=0,
-                    avg_response_time_ms=0,
-                    min_response_time_ms=0,
-                    max_response_time_ms=0,
-                    requests_per_second=0,
-                    error_rate_percent=0,
-                    status_code_distribution={},
-                    endpoint_statistics={}
-                )
-            
-            total_requests = len(self.metrics)
-            successful_requests = len([m for m in self.metrics if 200 <= m.status_code < 300])
-            failed_requests = total_requests - successful_requests
-            
-            response_times = [m.response_time_ms for m in self.metrics]
-            avg_response_time = sum(response_times) / len(response_times)
-            
-            elapsed_time = self.simulation_end_time - self.simulation_start_time
-            requests_per_second = total_requests / elapsed_time if elapsed_time > 0 else 0
-            
-            error_rate = (failed_requests / total_requests * 100) if total_requests > 0 else 0
-            
+        if aggregates.total_requests == 0:
             return SimulationSummary(
                 simulation_id=self.simulation_id,
-                start_time=datetime.fromtimestamp(self.simulation_start_time, timezone.utc).isoformat(),
-                end_time=datetime.fromtimestamp(self.simulation_end_time, timezone.utc).isoformat(),
-                total_requests=total_requests,
-                successful_requests=successful_requests,
-                failed_requests=failed_requests,
-                avg_response_time_ms=round(avg_response_time, 2),
-                min_response_time_ms=round(min(response_times), 2),
-                max_response_time_ms=round(max(response_times), 2),
-                requests_per_second=round(requests_per_second, 2),
-                error_rate_percent=round(error_rate, 2),
-                status_code_distribution=self.get_status_code_distribution(),
-                endpoint_statistics=self.get_endpoint_statistics()
+                start_time=start_time,
+                end_time=end_time,
+                total_requests=0,
+                successful_requests=0,
+                failed_requests=0,
+                avg_response_time_ms=0,
+                min_response_time_ms=0,
+                max_response_time_ms=0,
+                requests_per_second=0,
+                error_rate_percent=0,
+                status_code_distribution={},
+                endpoint_statistics={}
             )
+        
+        total_requests = aggregates.total_requests
+        successful_requests = aggregates.successful_requests
+        failed_requests = total_requests - successful_requests
+        response_times = aggregates.response_times
+        
+        elapsed_time = self.simulation_end_time - self.simulation_start_time
+        requests_per_second = total_requests / elapsed_time if elapsed_time > 0 else 0
+        
+        error_rate = (failed_requests / total_requests * 100) if total_requests > 0 else 0
+        
+        return SimulationSummary(
+            simulation_id=self.simulation_id,
+            start_time=start_time,
+            end_time=end_time,
+            total_requests=total_requests,
+            successful_requests=successful_requests,
+            failed_requests=failed_requests,
+            avg_response_time_ms=round(response_times.total_ms / response_times.count, 2),
+            min_response_time_ms=round(response_times.min_ms, 2),
+            max_response_time_ms=round(response_times.max_ms, 2),
+            requests_per_second=round(requests_per_second, 2),
+            error_rate_percent=round(error_rate, 2),
+            status_code_distribution=aggregates.status_codes,
+            endpoint_statistics=endpoint_statistics
+        )
     
     def export_metrics(self, include_raw_data: bool = True) -> str:
         """
         Export metrics to JSON file.
         
+        Individual request metrics are streamed to a separate NDJSON file, one
+        record per line, whose name is stored under 'raw_metrics_file'.
+        
         Args:
             include_raw_data: Whether to include individual request metrics
             
@@ -333,31 +463,47 @@ class MetricsCollector:
         filename = f"simulation_{self.simulation_id}_{timestamp}.json"
         filepath = os.path.join(self.output_directory, filename)
         
+        summary, status_distribution, endpoint_statistics, error_analysis = self._compute_all()
         export_data = {
-            'simulation_summary': asdict(self.finish_simulation()),
-            'status_code_distribution': self.get_status_code_distribution(),
-            'endpoint_statistics': self.get_endpoint_statistics(),
-            'error_analysis': self.get_error_analysis(),
+            'simulation_summary': asdict(summary),
+            'status_code_distribution': status_distribution,
+            'endpoint_statistics': endpoint_statistics,
+            'error_analysis': error_analysis,
             'export_timestamp': datetime.now(timezone.utc).isoformat()
         }
         
         if include_raw_data:
-            with self.lock:
-                export_data['raw_metrics'] = [asdict(metric) for metric in self.metrics]
+            raw_filename = f"simulation_{self.simulation_id}_{timestamp}_raw_metrics.ndjson"
+            self._write_raw_metrics(os.path.join(self.output_directory, raw_filename))
+            export_data['raw_metrics_file'] = raw_filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        # Status code distributions are keyed by int, which orjson only accepts with OPT_NON_STR_KEYS
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         return filepath
     
+    def _write_raw_metrics(self, filepath: str) -> None:
+        """Stream every recorded request metric to an NDJSON file."""
+        # Iterate over a snapshot, so requests recorded meanwhile cannot break the iteration
+        with self.lock:
+            metrics = self.metrics.copy()
+        
+        with open(filepath, 'wb') as f:
+            for metric in metrics:
+                # Splice the timestamp in as the first field of the serialised dataclass
+                timestamp = datetime.fromtimestamp(metric.request_start_time, timezone.utc).isoformat()
+                f.write(b'{"timestamp":"' + timestamp.encode() + b'",')
+                f.write(orjson.dumps(metric, option=orjson.OPT_APPEND_NEWLINE)[1:])
+    
     def get_metrics_count(self) -> int:
         """Get current number of collected metrics."""
-        with self.lock:
-            return len(self.metrics)
+        return len(self.metrics)
     
     def clear_metrics(self) -> None:
-        """Clear all collected metrics (useful for testing)."""
+        """Clear all collected metrics and restart the simulation clock."""
         with self.lock:
             self.metrics.clear()
+            self._aggregates = _RunningAggregates()
             self.simulation_start_time = time.time()
             self.simulation_end_time = None
\ No newline at end of file
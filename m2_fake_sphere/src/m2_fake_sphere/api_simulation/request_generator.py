@@ -5,25 +5,104 @@ This module generates synthetic API requests based on Swagger specifications
 using Faker library for realistic test data generation.
 """
 
+import ast
 import json
 import re
-from typing import Dict, List, Any, Optional, Union
+import sys
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Any, Optional, Pattern, Set, Tuple, Union
 from faker import Faker
+import numpy as np
+from dataclasses import dataclass
 from datetime import datetime, date
 import random
 import uuid
 
 
+FieldGenerator = Callable[[], Any]
+
+# Marks a schema without an example, since None is a valid example value
+_MISSING = object()
+
+# Faker instances shared by unseeded generators, keyed by locale
+_FAKER_CACHE: Dict[str, Faker] = {}
+
+
+def _shared_faker(locale: str) -> Faker:
+    """
+    Return the Faker instance shared by every unseeded generator of a locale.
+    
+    Building a Faker loads all of its providers, so it is done once per
+    locale. The shared instance also shares its random state: generators
+    that need reproducible values are given a private, seeded instance.
+    """
+    faker = _FAKER_CACHE.get(locale)
+    if faker is None:
+        faker = _FAKER_CACHE.setdefault(locale, Faker(locale))
+    return faker
+
+
+@dataclass(slots=True)
+class ResolvedField:
+    """How a field is generated, along with what its confidence report shows."""
+    name: str
+    location: str
+    required: bool
+    field_type: str
+    faker_method: Optional[str]
+    generate: FieldGenerator
+
+
+@dataclass(slots=True)
+class CompiledEndpoint:
+    """Field generators resolved once for every field of an endpoint."""
+    endpoint: Dict[str, Any]
+    fields: List[ResolvedField]
+    path_params: List[Tuple[str, FieldGenerator]]
+    query_params: List[Tuple[str, FieldGenerator, int]]
+    optional_query_count: int
+    headers: List[Tuple[str, FieldGenerator]]
+    body: Optional[FieldGenerator]
+
+
 class RequestGenerator:
     """Generates synthetic API requests using Faker for data generation."""
     
-    def __init__(self, locale: str = 'en_US'):
-        self.faker = Faker(locale)
+    # Upper bound on cached endpoint plans; the oldest plan is dropped beyond it
+    MAX_ENDPOINT_PLANS = 1024
+    
+    def __init__(self, locale: str = 'en_US', seed: Optional[int] = None):
+        # A seed makes every generated value reproducible: Faker, our own RNG
+        # and numpy are all seeded from it
+        if seed is None:
+            self.faker = _shared_faker(locale)
+        else:
+            self.faker = Faker(locale)
+            self.faker.seed_instance(seed)
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed)
         self.field_mappings = self._initialize_field_mappings()
+        self._keyword_table = self._build_keyword_table()
+        self._mappings_by_head, self._unfiltered_mappings = self._build_head_index()
+        self._keyword_methods = self._build_keyword_methods()
+        # Specs are parsed once here rather than on every generated value
+        self._faker_methods = {
+            faker_method: self._compile_faker_method(faker_method)
+            for _, faker_method in self.field_mappings
+        }
+        # Field names recur across endpoints and requests; remember each verdict
+        self._match_field_name = lru_cache(maxsize=4096)(self._match_field_name)
+        # Keyed by (method, path); each plan is checked against the endpoint it was built from
+        self._endpoint_plans: Dict[Tuple[str, str], CompiledEndpoint] = {}
         
-    def _initialize_field_mappings(self) -> Dict[str, str]:
-        """Initialize fuzzy matching patterns for field names to Faker methods."""
-        return {
+    def _initialize_field_mappings(self) -> List[Tuple[Pattern, str]]:
+        """
+        Initialize fuzzy matching patterns for field names to Faker methods.
+        
+        Patterns are compiled once here and tried in order, so the first
+        pattern that matches a field name decides its Faker method.
+        """
+        patterns = {
             # Personal Information
             r'(first_?name|fname|given_?name)': 'first_name',
             r'(last_?name|lname|surname|family_?name)': 'last_name',
@@ -92,6 +171,76 @@ class RequestGenerator:
             r'(status|state)': 'random_element(["active", "inactive", "pending", "completed"])',
             r'(type|kind|category)': 'random_element(["A", "B", "C", "premium", "standard", "basic"])',
         }
+        return [(re.compile(pattern), faker_method)
+                for pattern, faker_method in patterns.items()]
+    
+    def _build_keyword_table(self) -> List[Tuple[Tuple[str, ...], Optional[Pattern], str]]:
+        """
+        Split the field mappings into plain keywords wherever possible.
+        
+        Every mapping is an alternation of literal words with optional
+        underscores, so it matches exactly when one of its expanded keywords
+        is a substring of the lowercased name. Keywords containing a shorter
+        keyword of the same mapping add nothing to a substring test and are
+        dropped. A mapping using any other regex syntax keeps its pattern.
+        """
+        table = []
+        for pattern, faker_method in self.field_mappings:
+            alternatives = pattern.pattern.strip('()').split('|')
+            if not all(re.fullmatch(r'[a-z_?]+', alternative) for alternative in alternatives):
+                table.append(((), pattern, faker_method))
+                continue
+            keywords = self._expand_keywords(alternatives)
+            keywords = tuple(sorted(
+                keyword for keyword in keywords
+                if not any(other != keyword and other in keyword for other in keywords)
+            ))
+            table.append((keywords, None, faker_method))
+        return table
+    
+    def _build_head_index(self) -> Tuple[Dict[str, Set[int]], Set[int]]:
+        """
+        Index the keyword table by the first two characters of each keyword.
+        
+        A keyword can only occur in a field name that contains its leading
+        pair of characters, so a name is scanned against just the mappings
+        whose heads it contains. Mappings that keep a regex, or that have a
+        one-character keyword, cannot be indexed and are always scanned.
+        """
+        mappings_by_head: Dict[str, Set[int]] = {}
+        unfiltered = set()
+        for index, (keywords, pattern, _) in enumerate(self._keyword_table):
+            if pattern is not None or any(len(keyword) < 2 for keyword in keywords):
+                unfiltered.add(index)
+                continue
+            for keyword in keywords:
+                mappings_by_head.setdefault(keyword[:2], set()).add(index)
+        return mappings_by_head, unfiltered
+    
+    def _expand_keywords(self, alternatives: List[str]) -> Set[str]:
+        """Expand each optional underscore into both spellings of a keyword."""
+        keywords = set()
+        for alternative in alternatives:
+            keywords.add(alternative.replace('_?', '_'))
+            keywords.add(alternative.replace('_?', ''))
+        return keywords
+    
+    def _build_keyword_methods(self) -> Dict[str, Optional[str]]:
+        """
+        Resolve every literal keyword of the field mappings ahead of time.
+        
+        Field names are very often a keyword verbatim ('id', 'email',
+        'first_name'), so those are answered by a dict lookup. Each entry is
+        resolved by a full scan, which keeps the mapping order intact for
+        keywords that an earlier mapping also matches.
+        """
+        keyword_methods = {}
+        for pattern, _ in self.field_mappings:
+            alternatives = pattern.pattern.strip('()').split('|')
+            if all(re.fullmatch(r'[a-z_?]+', alternative) for alternative in alternatives):
+                for keyword in self._expand_keywords(alternatives):
+                    keyword_methods[keyword] = self._scan_field_name(keyword)
+        return keyword_methods
     
     def generate_value_for_field(self, field_name: str, field_schema: Dict[str, Any]) -> Any:
         """
@@ -104,23 +253,55 @@ class RequestGenerator:
         Returns:
             Generated value appropriate for the field
         """
-        field_type = self._get_field_type(field_schema)
-        
-        # Check for enum values first
-        if 'enum' in field_schema:
-            return random.choice(field_schema['enum'])
+        # Enum and example values need neither a field-name match nor a generator
+        if isinstance(field_schema, dict):
+            enum = field_schema.get('enum')
+            if enum is not None:
+                return self._rng.choice(enum)
+            example = field_schema.get('example', _MISSING)
+            if example is not _MISSING:
+                return example
         
-        # Check for example values
-        if 'example' in field_schema:
-            return field_schema['example']
+        faker_method = self._match_field_name(sys.intern(field_name.lower()))
+        return self._compile_field(field_schema, faker_method)()
+    
+    def _resolve_field(self, field_name: str, field_schema: Dict[str, Any],
+                       location: str, required: bool) -> ResolvedField:
+        """Match a field name once and resolve both its generator and its report."""
+        faker_method = self._match_field_name(sys.intern(field_name.lower()))
+        return ResolvedField(
+            name=field_name,
+            location=location,
+            required=required,
+            field_type=self._get_field_type(field_schema),
+            faker_method=faker_method,
+            generate=self._compile_field(field_schema, faker_method)
+        )
+    
+    def _compile_field(self, field_schema: Dict[str, Any], faker_method: Optional[str]) -> FieldGenerator:
+        """Resolve how a field is generated into a callable producing its values."""
+        if isinstance(field_schema, dict):
+            # Check for enum values first
+            enum = field_schema.get('enum')
+            if enum is not None:
+                return partial(self._rng.choice, enum)
+            
+            # Check for example values
+            example = field_schema.get('example', _MISSING)
+            if example is not _MISSING:
+                return lambda: example
         
-        # Try fuzzy matching on field name
-        faker_method = self._match_field_name(field_name.lower())
+        # Use the Faker method matched on the field name
         if faker_method:
-            return self._execute_faker_method(faker_method)
+            return self._faker_method(faker_method)
         
         # Fall back to type-based generation
-        return self._generate_by_type(field_type, field_schema)
+        field_type = self._get_field_type(field_schema)
+        if field_type == 'object':
+            return self._compile_object(field_schema)
+        if field_type == 'array':
+            return self._compile_array(field_schema)
+        return partial(self._generate_by_type, field_type, field_schema)
     
     def _get_field_type(self, schema: Dict[str, Any]) -> str:
         """Extract field type from schema."""
@@ -131,51 +312,78 @@ class RequestGenerator:
         return 'string'
     
     def _match_field_name(self, field_name: str) -> Optional[str]:
-        """Match field name to Faker method using fuzzy patterns."""
-        for pattern, faker_method in self.field_mappings.items():
-            if re.search(pattern, field_name, re.IGNORECASE):
-                return faker_method
+        """Match a lowercased field name to Faker method using fuzzy patterns."""
+        if field_name in self._keyword_methods:
+            return self._keyword_methods[field_name]
+        return self._scan_field_name(field_name)
+    
+    def _scan_field_name(self, field_name: str) -> Optional[str]:
+        """Find the first mapping with a keyword inside a lowercased field name."""
+        candidates = set(self._unfiltered_mappings)
+        for start in range(len(field_name) - 1):
+            heads = self._mappings_by_head.get(field_name[start:start + 2])
+            if heads:
+                candidates.update(heads)
+        
+        for index in sorted(candidates):
+            keywords, pattern, faker_method = self._keyword_table[index]
+            if pattern is not None:
+                if pattern.search(field_name):
+                    return faker_method
+                continue
+            for keyword in keywords:
+                if keyword in field_name:
+                    return faker_method
         return None
     
+    def _compile_faker_method(self, method_spec: str) -> Callable[[], Any]:
+        """
+        Parse a Faker method specification into a ready-to-call callable.
+        
+        The Faker method is resolved to a bound method here, so generating a
+        value skips Faker's provider lookup. A method Faker does not have
+        falls back to a random word.
+        """
+        method_name, args, kwargs = self._parse_method_spec(method_spec)
+        
+        if method_name == 'random_element' and len(args) == 1:
+            return partial(self._rng.choice, tuple(args[0]))
+        
+        if method_name == 'random_int' and len(args) == 2:
+            # Bounded ints skip Faker's wrapper and draw straight from our RNG
+            min_val, max_val = args
+            return partial(self._rng.randrange, min_val, max_val + 1)
+        
+        bound_method = getattr(self.faker, method_name, None)
+        if bound_method is None:
+            return self.faker.word
+        
+        if args or kwargs:
+            return partial(bound_method, *args, **kwargs)
+        return bound_method
+    
+    def _parse_method_spec(self, method_spec: str) -> Tuple[str, Tuple[Any, ...], Dict[str, Any]]:
+        """Split a spec such as 'random_int(10, 1000)' into name, args and kwargs."""
+        node = ast.parse(method_spec, mode='eval').body
+        if isinstance(node, ast.Name):
+            return node.id, (), {}
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+            raise ValueError(f"Invalid Faker method specification: {method_spec}")
+        
+        args = tuple(ast.literal_eval(arg) for arg in node.args)
+        kwargs = {keyword.arg: ast.literal_eval(keyword.value) for keyword in node.keywords}
+        return node.func.id, args, kwargs
+    
+    def _faker_method(self, method_spec: str) -> Callable[[], Any]:
+        """Return the compiled callable for a Faker method specification."""
+        faker_method = self._faker_methods.get(method_spec)
+        if faker_method is None:
+            faker_method = self._faker_methods[method_spec] = self._compile_faker_method(method_spec)
+        return faker_method
+    
     def _execute_faker_method(self, method_spec: str) -> Any:
         """Execute Faker method specification."""
-        try:
-            # Handle methods with parameters
-            if '(' in method_spec:
-                # Extract method name and parameters
-                method_name = method_spec.split('(')[0]
-                params_str = method_spec.split('(')[1].rstrip(')')
-                
-                # Evaluate parameters safely
-                if params_str:
-                    # Simple parameter parsing for common cases
-                    if method_name == 'random_int':
-                        min_val, max_val = map(int, params_str.split(', '))
-                        return self.faker.random_int(min_val, max_val)
-                    elif method_name == 'text':
-                        return self.faker.text(max_nb_chars=int(params_str.split('=')[1]))
-                    elif method_name == 'sentence':
-                        if 'nb_words' in params_str:
-                            nb_words = int(params_str.split('=')[1])
-                            return self.faker.sentence(nb_words=nb_words)
-                        return self.faker.sentence()
-                    elif method_name == 'random_element':
-                        # Parse list of options
-                        elements_str = params_str.strip('[]"')
-                        elements = [elem.strip(' "') for elem in elements_str.split('", "')]
-                        return random.choice(elements)
-                
-                # Fallback to method without parameters
-                return getattr(self.faker, method_name)()
-            else:
-                # Simple method call
-                return getattr(self.faker, method_spec)()
-        except AttributeError:
-            # Fallback if Faker method doesn't exist
-            return self.faker.word()
-        except Exception:
-            # Fallback for any other errors
-            return "generated_value"
+        return self._faker_method(method_spec)()
     
     def _generate_by_type(self, field_type: str, schema: Dict[str, Any]) -> Any:
         """Generate value based on field type."""
@@ -192,23 +400,18 @@ class RequestGenerator:
         elif field_type == 'integer':
             minimum = schema.get('minimum', 0)
             maximum = schema.get('maximum', 1000)
-            return self.faker.random_int(minimum, maximum)
+            return self._rng.randrange(minimum, maximum + 1)
         
         elif field_type == 'number':
             minimum = schema.get('minimum', 0.0)
             maximum = schema.get('maximum', 1000.0)
-            return round(random.uniform(minimum, maximum), 2)
+            return round(self._rng.uniform(minimum, maximum), 2)
         
         elif field_type == 'boolean':
             return self.faker.boolean()
         
         elif field_type == 'array':
-            items_schema = schema.get('items', {'type': 'string'})
-            min_items = schema.get('minItems', 1)
-            max_items = schema.get('maxItems', 5)
-            array_length = random.randint(min_items, max_items)
-            return [self._generate_by_type(self._get_field_type(items_schema), items_schema) 
-                   for _ in range(array_length)]
+            return self._compile_array(schema)()
         
         elif field_type == 'object':
             return self._generate_object_from_schema(schema)
@@ -218,16 +421,86 @@ class RequestGenerator:
     
     def _generate_object_from_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Generate object from schema properties."""
-        obj = {}
-        properties = schema.get('properties', {})
+        return self._compile_object(schema)()
+    
+    def _compile_array(self, schema: Dict[str, Any]) -> Callable[[], List[Any]]:
+        """
+        Resolve an array schema's item generator once.
+        
+        The returned callable only draws the array length and then the items,
+        so object items are not resolved again for every generated array.
+        """
+        items_schema = schema.get('items', {'type': 'string'})
+        min_items = schema.get('minItems', 1)
+        max_items = schema.get('maxItems', 5)
+        items_type = self._get_field_type(items_schema)
+        randint = self._rng.randint
+        
+        # Draw numeric items in one vectorized call
+        if items_type == 'integer':
+            integers = self._np_rng.integers
+            minimum = items_schema.get('minimum', 0)
+            maximum = items_schema.get('maximum', 1000)
+            return lambda: integers(minimum, maximum, size=randint(min_items, max_items), endpoint=True).tolist()
+        if items_type == 'number':
+            uniform = self._np_rng.uniform
+            minimum = items_schema.get('minimum', 0.0)
+            maximum = items_schema.get('maximum', 1000.0)
+            return lambda: np.round(uniform(minimum, maximum, size=randint(min_items, max_items)), 2).tolist()
+        
+        if items_type == 'object':
+            generate_item = self._compile_object(items_schema)
+        elif items_type == 'array':
+            generate_item = self._compile_array(items_schema)
+        else:
+            generate_item = partial(self._generate_by_type, items_type, items_schema)
+        return lambda: [generate_item() for _ in range(randint(min_items, max_items))]
+    
+    def _compile_object(self, schema: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Resolve the generators of an object schema's properties once."""
+        return self._object_generator(self._resolve_properties(schema, 'body'))
+    
+    def _resolve_properties(self, schema: Dict[str, Any], location: str) -> List[ResolvedField]:
+        """Resolve every property of an object schema."""
         required = schema.get('required', [])
+        return [
+            self._resolve_field(prop_name, prop_schema, location, prop_name in required)
+            for prop_name, prop_schema in schema.get('properties', {}).items()
+        ]
+    
+    def _object_generator(self, fields: List[ResolvedField]) -> Callable[[], Dict[str, Any]]:
+        """Build a callable generating an object from its resolved properties."""
+        properties, optional_count = self._with_optional_bits(fields)
+        getrandbits = self._rng.getrandbits
         
-        for prop_name, prop_schema in properties.items():
-            # Include required fields and randomly include optional fields
-            if prop_name in required or random.choice([True, False]):
-                obj[prop_name] = self.generate_value_for_field(prop_name, prop_schema)
+        def generate_object() -> Dict[str, Any]:
+            # Include required fields and randomly include optional fields,
+            # drawing the inclusion bits for all optional fields at once
+            included = getrandbits(optional_count)
+            return {
+                prop_name: generate()
+                for prop_name, generate, bit in properties
+                if not bit or included & bit
+            }
+        
+        return generate_object
+    
+    def _with_optional_bits(self, fields: List[ResolvedField]) -> Tuple[List[Tuple[str, FieldGenerator, int]], int]:
+        """
+        Pair each field with its bit in a random inclusion mask.
         
-        return obj
+        Required fields get 0 and are always included; optional fields get
+        one bit each. Returns the triples and the number of optional fields.
+        """
+        triples = []
+        optional_count = 0
+        for field in fields:
+            if field.required:
+                triples.append((field.name, field.generate, 0))
+            else:
+                triples.append((field.name, field.generate, 1 << optional_count))
+                optional_count += 1
+        return triples, optional_count
     
     def generate_request_data(self, endpoint: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -239,43 +512,83 @@ class RequestGenerator:
         Returns:
             Dictionary containing generated request data
         """
-        request_data = {
-            'path_params': {},
-            'query_params': {},
-            'headers': {},
-            'body': None
+        plan = self._endpoint_plan(endpoint)
+        included = self._rng.getrandbits(plan.optional_query_count)
+        
+        return {
+            'path_params': {name: generate() for name, generate in plan.path_params},
+            # Include required parameters and randomly include optional ones
+            'query_params': {
+                name: generate()
+                for name, generate, bit in plan.query_params
+                if not bit or included & bit
+            },
+            'headers': {name: generate() for name, generate in plan.headers},
+            'body': plan.body() if plan.body is not None else None
         }
+    
+    def _endpoint_plan(self, endpoint: Dict[str, Any]) -> CompiledEndpoint:
+        """
+        Return the compiled plan for an endpoint, compiling it on first use.
         
-        # Generate path parameters
-        for param in endpoint.get('parameters', []):
-            if param.get('in') == 'path':
-                request_data['path_params'][param['name']] = self.generate_value_for_field(
-                    param['name'], param.get('schema', {})
-                )
+        A cached plan is reused for the same endpoint dict, or for an equal one,
+        so callers passing fresh copies share it. An endpoint dict must not be
+        modified after its first use, since the same object keeps its plan.
+        """
+        key = (endpoint.get('method'), endpoint.get('path'))
+        plans = self._endpoint_plans
+        plan = plans.get(key)
+        if plan is None or (plan.endpoint is not endpoint and plan.endpoint != endpoint):
+            if plan is None and len(plans) >= self.MAX_ENDPOINT_PLANS:
+                del plans[next(iter(plans))]
+            plan = plans[key] = self.compile_endpoint(endpoint)
+        return plan
+    
+    def compile_endpoint(self, endpoint: Dict[str, Any]) -> CompiledEndpoint:
+        """
+        Resolve the generators for every field of an endpoint.
+        
+        generate_request_data and create_confidence_mapping compile each
+        endpoint once and share the plan for every later call, so field-name
+        matching and schema walking are not repeated per request. Endpoint
+        dicts must not be modified after their first use.
+        
+        Args:
+            endpoint: Endpoint definition from Swagger parser
+            
+        Returns:
+            Compiled plan for the endpoint
+        """
+        fields = []
+        path_params = []
+        query_fields = []
+        headers = []
         
-        # Generate query parameters
-        for param in endpoint.get('parameters', []):
-            if param.get('in') == 'query':
-                # Include required parameters and randomly include optional ones
-                if param.get('required', False) or random.choice([True, False]):
-                    request_data['query_params'][param['name']] = self.generate_value_for_field(
-                        param['name'], param.get('schema', {})
-                    )
-        
-        # Generate headers
         for param in endpoint.get('parameters', []):
-            if param.get('in') == 'header':
-                request_data['headers'][param['name']] = self.generate_value_for_field(
-                    param['name'], param.get('schema', {})
-                )
+            field = self._resolve_field(
+                param['name'], param.get('schema', {}),
+                param.get('in', 'unknown'), param.get('required', False)
+            )
+            fields.append(field)
+            if field.location == 'path':
+                path_params.append((field.name, field.generate))
+            elif field.location == 'query':
+                query_fields.append(field)
+            elif field.location == 'header':
+                headers.append((field.name, field.generate))
         
-        # Generate request body
+        # Request body fields are reported for every method but only sent with some
+        body = None
         request_body = endpoint.get('request_body')
-        if request_body and endpoint['method'] in ['POST', 'PUT', 'PATCH']:
-            schema = request_body.get('schema', {})
-            request_data['body'] = self._generate_object_from_schema(schema)
+        if request_body:
+            body_fields = self._resolve_properties(request_body.get('schema', {}), 'body')
+            fields.extend(body_fields)
+            if endpoint['method'] in ['POST', 'PUT', 'PATCH']:
+                body = self._object_generator(body_fields)
         
-        return request_data
+        query_params, optional_query_count = self._with_optional_bits(query_fields)
+        return CompiledEndpoint(endpoint, fields, path_params, query_params,
+                                optional_query_count, headers, body)
     
     def create_confidence_mapping(self, endpoint: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
@@ -287,43 +600,13 @@ class RequestGenerator:
         Returns:
             Dictionary with confidence scores for each field mapping
         """
-        mapping = {}
-        
-        # Analyze all parameters
-        for param in endpoint.get('parameters', []):
-            field_name = param['name']
-            faker_method = self._match_field_name(field_name.lower())
-            
-            confidence = 'high' if faker_method else 'low'
-            if not faker_method:
-                faker_method = 'random_word'  # Default fallback
-            
-            mapping[field_name] = {
-                'faker_method': faker_method,
-                'confidence': confidence,
-                'field_type': self._get_field_type(param.get('schema', {})),
-                'required': param.get('required', False),
-                'location': param.get('in', 'unknown')
+        return {
+            field.name: {
+                'faker_method': field.faker_method or 'random_word',  # Default fallback
+                'confidence': 'high' if field.faker_method else 'low',
+                'field_type': field.field_type,
+                'required': field.required,
+                'location': field.location
             }
-        
-        # Analyze request body fields
-        request_body = endpoint.get('request_body')
-        if request_body:
-            schema = request_body.get('schema', {})
-            properties = schema.get('properties', {})
-            
-            for prop_name, prop_schema in properties.items():
-                faker_method = self._match_field_name(prop_name.lower())
-                confidence = 'high' if faker_method else 'low'
-                if not faker_method:
-                    faker_method = 'random_word'
-                
-                mapping[prop_name] = {
-                    'faker_method': faker_method,
-                    'confidence': confidence,
-                    'field_type': self._get_field_type(prop_schema),
-                    'required': prop_name in schema.get('required', []),
-                    'location': 'body'
-                }
-        
-        return mapping
\ No newline at end of file
+            for field in self._endpoint_plan(endpoint).fields
+        }
\ No newline at end of file
@@ -9,25 +9,39 @@ This module orchestrates the entire API simulation process including:
 - Real-time status reporting
 """
 
-import json
+import random
+import re
 import yaml
 import time
 import uuid
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, asdict
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Deque, Dict, List, Any, Optional, Callable, Tuple
+from dataclasses import dataclass
 from pathlib import Path
 import requests
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin, urlparse
 import os
 
+import orjson
+
 from .swagger_parser import SwaggerParser
 from .request_generator import RequestGenerator
 from .metrics_collector import MetricsCollector
 
 
-@dataclass
+# A {name} placeholder in an endpoint path
+_PATH_PARAM_PATTERN = re.compile(r'\{([^{}]+)\}')
+
+
+def _substring_pattern(substrings: List[str]) -> re.Pattern:
+    """Compile a pattern matching any text that contains one of substrings."""
+    return re.compile('|'.join(map(re.escape, substrings)))
+
+
+@dataclass(slots=True)
 class SimulationConfig:
     """Configuration for API simulation."""
     simulation_name: str
@@ -43,7 +57,7 @@ class SimulationConfig:
     custom_headers: Dict[str, str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationStatus:
     """Current simulation status."""
     simulation_id: str
@@ -58,8 +72,32 @@ class SimulationStatus:
     last_error: Optional[str] = None
 
 
+@dataclass(slots=True)
+class RequestTemplate:
+    """
+    Per-endpoint request data that does not change between requests.
+    
+    url is the full request URL for endpoints without path parameters and
+    None otherwise, since those are only known once parameters are generated.
+    """
+    endpoint: Dict[str, Any]
+    method: str
+    path: str
+    url: Optional[str]
+    has_path_params: bool
+
+
 class ControlFile:
-    """Manages simulation control through file-based coordination."""
+    """
+    Manages simulation control through file-based coordination.
+    
+    The authoritative state is kept in memory and mirrored to the control
+    file. Status changes and stop/pause requests are written through at once;
+    progress updates, which arrive once per completed request, are written at
+    most every FLUSH_INTERVAL_SECONDS.
+    """
+    
+    FLUSH_INTERVAL_SECONDS = 0.5
     
     def __init__(self, simulation_id: str, control_directory: str = "./data/simulations/active"):
         self.simulation_id = simulation_id
@@ -67,9 +105,17 @@ class ControlFile:
         self.control_directory.mkdir(parents=True, exist_ok=True)
         self.control_file_path = self.control_directory / f"{simulation_id}_control.json"
         self._lock = threading.Lock()
+        self._last_flush = 0.0
+        
+        # Checked by the engine for every request, so kept off the file entirely
+        self._stop_requested = threading.Event()
+        self._pause_requested = threading.Event()
+        # Set unless paused; paused waiters block on it and wake on resume or stop
+        self._resumed = threading.Event()
+        self._resumed.set()
         
         # Initialize control file
-        self._write_control_data({
+        self._state: Dict[str, Any] = {
             'simulation_id': simulation_id,
             'status': 'initializing',
             'created_at': time.time(),
@@ -79,69 +125,77 @@ class ControlFile:
             'current_requests': 0,
             'target_requests': 0,
             'error_count': 0
-        })
+        }
+        with self._lock:
+            self._flush()
     
     def _write_control_data(self, data: Dict[str, Any]) -> None:
         """Write control data to file."""
-        with self._lock:
-            with open(self.control_file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+        self.control_file_path.write_bytes(orjson.dumps(data))
     
     def _read_control_data(self) -> Dict[str, Any]:
-        """Read control data from file."""
+        """Read a snapshot of the control data."""
         with self._lock:
-            if self.control_file_path.exists():
-                with open(self.control_file_path, 'r') as f:
-                    return json.load(f)
-            return {}
+            return dict(self._state)
+    
+    def _flush(self) -> None:
+        """Write the in-memory state to the control file. Call with the lock held."""
+        self._write_control_data(self._state)
+        self._last_flush = time.monotonic()
+    
+    def _update(self, flush: bool, **changes) -> None:
+        """Apply changes to the control state and write it out if requested."""
+        with self._lock:
+            self._state.update(changes)
+            self._state['updated_at'] = time.time()
+            if flush or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SECONDS:
+                self._flush()
     
     def update_status(self, status: str, **kwargs) -> None:
         """Update simulation status."""
-        data = self._read_control_data()
-        data['status'] = status
-        data['updated_at'] = time.time()
-        data.update(kwargs)
-        self._write_control_data(data)
+        self._update(True, status=status, **kwargs)
     
     def update_progress(self, current_requests: int, error_count: int = None) -> None:
         """Update simulation progress."""
-        data = self._read_control_data()
-        data['current_requests'] = current_requests
-        data['updated_at'] = time.time()
-        if error_count is not None:
-            data['error_count'] = error_count
-        self._write_control_data(data)
+        if error_count is None:
+            self._update(False, current_requests=current_requests)
+        else:
+            self._update(False, current_requests=current_requests, error_count=error_count)
     
     def should_stop(self) -> bool:
         """Check if simulation should stop."""
-        data = self._read_control_data()
-        return data.get('should_stop', False)
+        return self._stop_requested.is_set()
     
     def should_pause(self) -> bool:
         """Check if simulation should pause."""
-        data = self._read_control_data()
-        return data.get('should_pause', False)
+        return self._pause_requested.is_set()
+    
+    def wait_while_paused(self) -> None:
+        """Block while the simulation is paused, returning on resume or stop."""
+        self._resumed.wait()
     
     def request_stop(self) -> None:
         """Request simulation to stop."""
-        data = self._read_control_data()
-        data['should_stop'] = True
-        data['updated_at'] = time.time()
-        self._write_control_data(data)
+        with self._lock:
+            self._stop_requested.set()
+            self._resumed.set()
+        self._update(True, should_stop=True)
     
     def request_pause(self) -> None:
         """Request simulation to pause."""
-        data = self._read_control_data()
-        data['should_pause'] = True
-        data['updated_at'] = time.time()
-        self._write_control_data(data)
+        with self._lock:
+            self._pause_requested.set()
+            # A stopped simulation must never be left waiting for a resume
+            if not self._stop_requested.is_set():
+                self._resumed.clear()
+        self._update(True, should_pause=True)
     
     def resume(self) -> None:
         """Resume paused simulation."""
-        data = self._read_control_data()
-        data['should_pause'] = False
-        data['updated_at'] = time.time()
-        self._write_control_data(data)
+        with self._lock:
+            self._pause_requested.clear()
+            self._resumed.set()
+        self._update(True, should_pause=False)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current status from control file."""
@@ -156,16 +210,25 @@ class ControlFile:
 class AuthenticationHandler:
     """Handles various authentication schemes."""
     
+    TOKEN_ERROR_REPORT_EVERY = 100
+    
     def __init__(self, auth_config: Dict[str, Any]):
         self.auth_config = auth_config
         self.auth_type = auth_config.get('type', 'none')
+        # Replaced wholesale on refresh, so readers can use it without the lock
         self._token_cache = {}
+        # Held while fetching a token so concurrent workers don't all refresh
+        self._token_lock = threading.Lock()
+        self._token_errors = 0
         
     def get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers for requests."""
         if self.auth_type == 'bearer':
             token = self._get_bearer_token()
             if token:
+                token_cache = self._token_cache
+                if token_cache.get('access_token') == token:
+                    return token_cache['headers']
                 return {'Authorization': f'Bearer {token}'}
         elif self.auth_type == 'api_key':
             api_key = self.auth_config.get('api_key')
@@ -181,10 +244,8 @@ class AuthenticationHandler:
     def _get_bearer_token(self) -> Optional[str]:
         """Get or refresh bearer token."""
         # Check if we have a cached valid token
-        cached_token = self._token_cache.get('access_token')
-        expires_at = self._token_cache.get('expires_at', 0)
-        
-        if cached_token and time.time() < expires_at:
+        cached_token = self._valid_cached_token()
+        if cached_token:
             return cached_token
         
         # Get new token
@@ -192,30 +253,62 @@ class AuthenticationHandler:
         client_id = self.auth_config.get('client_id')
         client_secret = self.auth_config.get('client_secret')
         
+        static_token = self.auth_config.get('static_token')
         if not all([token_url, client_id, client_secret]):
-            return self.auth_config.get('static_token')  # Fallback to static token
+            return static_token  # Fallback to static token
         
-        try:
-            response = requests.post(token_url, data={
-                'grant_type': 'client_credentials',
-                'client_id': client_id,
-                'client_secret': client_secret
-            })
-            response.raise_for_status()
-            
-            token_data = response.json()
-            access_token = token_data.get('access_token')
-            expires_in = token_data.get('expires_in', 3600)
-            
-            if access_token:
-                self._token_cache = {
-                    'access_token': access_token,
-                    'expires_at': time.time() + expires_in - 60  # Refresh 1 minute early
-                }
-                return access_token
-                
-        except Exception as e:
-            print(f"Error getting bearer token: {e}")
+        # A well-formed static token is used as-is, skipping the token endpoint
+        if self._looks_like_jwt(static_token):
+            return static_token
+        
+        with self._token_lock:
+            # Another worker may have refreshed the token while we waited
+            cached_token = self._valid_cached_token()
+            if cached_token:
+                return cached_token
+            try:
+                return self._fetch_bearer_token(token_url, client_id, client_secret)
+            except Exception as e:
+                # A dead token endpoint fails on every request, so only report periodically;
+                # counting under the lock keeps concurrent failures from skipping or repeating a report
+                self._token_errors += 1
+                if self._token_errors % self.TOKEN_ERROR_REPORT_EVERY == 1:
+                    print(f"Error getting bearer token ({self._token_errors} failures so far): {e}")
+                return None
+    
+    @staticmethod
+    def _looks_like_jwt(token: Optional[str]) -> bool:
+        """Cheap format check for a JWT: three dot-separated parts and a sane length."""
+        return bool(token) and token.count('.') == 2 and len(token) > 20
+    
+    def _valid_cached_token(self) -> Optional[str]:
+        """Return the cached token if it has not expired yet."""
+        token_cache = self._token_cache
+        cached_token = token_cache.get('access_token')
+        if cached_token and time.time() < token_cache.get('expires_at', 0):
+            return cached_token
+        return None
+    
+    def _fetch_bearer_token(self, token_url: str, client_id: str, client_secret: str) -> Optional[str]:
+        """Fetch a new bearer token from the token endpoint; called with _token_lock held."""
+        response = requests.post(token_url, data={
+            'grant_type': 'client_credentials',
+            'client_id': client_id,
+            'client_secret': client_secret
+        })
+        response.raise_for_status()
+        
+        token_data = response.json()
+        access_token = token_data.get('access_token')
+        expires_in = token_data.get('expires_in', 3600)
+        
+        if access_token:
+            self._token_cache = {
+                'access_token': access_token,
+                'expires_at': time.time() + expires_in - 60,  # Refresh 1 minute early
+                'headers': {'Authorization': f'Bearer {access_token}'}
+            }
+            return access_token
         
         return None
 
@@ -223,6 +316,11 @@ class AuthenticationHandler:
 class SimulationEngine:
     """Main simulation engine that orchestrates the entire process."""
     
+    METRICS_DRAIN_INTERVAL_SECONDS = 0.1
+    STATUS_DISPATCH_INTERVAL_SECONDS = 0.1
+    REQUEST_WINDOW_PER_THREAD = 2
+    RESPONSE_CHUNK_SIZE = 64 * 1024
+    
     def __init__(self, config: SimulationConfig):
         self.config = config
         self.simulation_id = str(uuid.uuid4())
@@ -232,14 +330,73 @@ class SimulationEngine:
         self.control_file = ControlFile(self.simulation_id)
         self.auth_handler = AuthenticationHandler(config.auth_config)
         
+        # One pooled session shared by all workers, so TCP connections and TLS
+        # sessions are reused instead of being set up again for every request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.concurrent_threads,
+            pool_maxsize=config.concurrent_threads * 2,
+            max_retries=0
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         self.status_callbacks: List[Callable[[SimulationStatus], None]] = []
         self.start_time = None
         self.is_running = False
         
+        # Endpoints are only picked on the submitting thread, so a private
+        # generator keeps that off the shared module-level random state
+        self._rng = random.Random()
+        
+        # Workers queue their request metrics here without taking any lock;
+        # a single drainer thread hands them to the collector in batches
+        self._pending_metrics: Deque[Dict[str, Any]] = deque()
+        self._metrics_drain_stop = threading.Event()
+        
+        # Latest (completed, errors, timestamp) progress snapshot; a dispatcher
+        # thread picks it up so slow callbacks never stall the request loop
+        self._status_slot: Optional[Tuple[int, int, float]] = None
+        self._status_cv = threading.Condition()
+        self._status_dispatch_stop = threading.Event()
+        
     def add_status_callback(self, callback: Callable[[SimulationStatus], None]) -> None:
         """Add callback for status updates."""
         self.status_callbacks.append(callback)
     
+    def _drain_pending_metrics(self) -> None:
+        """Record every queued request metric as one batch."""
+        batch = []
+        pending = self._pending_metrics
+        while pending:
+            batch.append(pending.popleft())
+        if batch:
+            self.metrics_collector.record_request_batch(batch)
+    
+    def _drain_metrics_periodically(self) -> None:
+        """Drain queued request metrics until the simulation ends, then drain the rest."""
+        while not self._metrics_drain_stop.wait(self.METRICS_DRAIN_INTERVAL_SECONDS):
+            self._drain_pending_metrics()
+        self._drain_pending_metrics()
+    
+    def _dispatch_status_updates(self) -> None:
+        """Deliver the latest progress snapshot to callbacks, at most once per interval."""
+        while True:
+            with self._status_cv:
+                self._status_cv.wait_for(
+                    lambda: self._status_slot is not None or self._status_dispatch_stop.is_set()
+                )
+                snapshot = self._status_slot
+                self._status_slot = None
+            
+            if snapshot is not None:
+                self._notify_status_change(self._build_running_status(*snapshot))
+            elif self._status_dispatch_stop.is_set():
+                return
+            
+            # Intermediate snapshots published meanwhile are superseded by the latest
+            self._status_dispatch_stop.wait(self.STATUS_DISPATCH_INTERVAL_SECONDS)
+    
     def _notify_status_change(self, status: SimulationStatus) -> None:
         """Notify all registered callbacks of status change."""
         for callback in self.status_callbacks:
@@ -259,17 +416,32 @@ class SimulationEngine:
             
             self.control_file.update_status('analyzing_endpoints')
             
-            # Filter endpoints if specified
+            # Filter endpoints if specified, scanning each path once per pattern list
             endpoints = self.swagger_parser.get_endpoints()
             if self.config.include_endpoints:
-                endpoints = [ep for ep in endpoints if any(inc in ep['path'] for inc in self.config.include_endpoints)]
+                include_search = _substring_pattern(self.config.include_endpoints).search
+                endpoints = [ep for ep in endpoints if include_search(ep['path'])]
             if self.config.exclude_endpoints:
-                endpoints = [ep for ep in endpoints if not any(exc in ep['path'] for exc in self.config.exclude_endpoints)]
+                exclude_search = _substring_pattern(self.config.exclude_endpoints).search
+                endpoints = [ep for ep in endpoints if not exclude_search(ep['path'])]
             
             if not endpoints:
                 raise Exception("No endpoints available for simulation after filtering")
             
             self.filtered_endpoints = endpoints
+            
+            # Resolve the request target once rather than re-parsing it per request
+            self._base_url = self.swagger_parser.get_base_url()
+            parsed_base_url = urlparse(self._base_url or '')
+            self._target_host = parsed_base_url.hostname
+            self._target_port = parsed_base_url.port or (443 if parsed_base_url.scheme == 'https' else 80)
+            
+            # Build everything about each endpoint's requests that is fixed up front
+            self._request_templates = [self._build_request_template(endpoint) for endpoint in endpoints]
+            self._base_headers = {
+                'Content-Type': 'application/json',
+                'User-Agent': f'FakeSphere-Simulator/{self.simulation_id}'
+            }
             self.control_file.update_status('ready', target_requests=self.config.target_requests)
             
             return True
@@ -278,6 +450,18 @@ class SimulationEngine:
             self.control_file.update_status('failed', error_message=str(e))
             return False
     
+    def _build_request_template(self, endpoint: Dict[str, Any]) -> RequestTemplate:
+        """Precompute the request template for an endpoint."""
+        path = endpoint['path']
+        has_path_params = _PATH_PARAM_PATTERN.search(path) is not None
+        return RequestTemplate(
+            endpoint=endpoint,
+            method=endpoint['method'],
+            path=path,
+            url=None if has_path_params else urljoin(self._base_url, path.lstrip('/')),
+            has_path_params=has_path_params
+        )
+    
     def start_simulation(self) -> bool:
         """Start the API simulation."""
         if not hasattr(self, 'filtered_endpoints'):
@@ -289,42 +473,85 @@ class SimulationEngine:
             self.is_running = True
             self.control_file.update_status('running')
             
-            # Create thread pool for concurrent requests
-            with ThreadPoolExecutor(max_workers=self.config.concurrent_threads) as executor:
-                # Submit all requests
-                future_to_request = {}
-                
-                for i in range(self.config.target_requests):
-                    if self.control_file.should_stop():
-                        break
-                    
+            self._metrics_drain_stop.clear()
+            metrics_drainer = threading.Thread(
+                target=self._drain_metrics_periodically,
+                name=f"metrics-drainer-{self.simulation_id}",
+                daemon=True
+            )
+            self._status_dispatch_stop.clear()
+            status_dispatcher = threading.Thread(
+                target=self._dispatch_status_updates,
+                name=f"status-dispatcher-{self.simulation_id}",
+                daemon=True
+            )
+            metrics_drainer.start()
+            status_dispatcher.start()
+            try:
+                self._run_requests()
+            finally:
+                self._metrics_drain_stop.set()
+                with self._status_cv:
+                    self._status_dispatch_stop.set()
+                    self._status_cv.notify()
+                metrics_drainer.join()
+                status_dispatcher.join()
+            
+            # Finalize simulation
+            self.is_running = False
+            final_status = 'completed' if not self.control_file.should_stop() else 'stopped'
+            self.control_file.update_status(final_status)
+            
+            return True
+            
+        except Exception as e:
+            self.is_running = False
+            self.control_file.update_status('failed', error_message=str(e))
+            return False
+    
+    def _run_requests(self) -> None:
+        """
+        Execute the simulation's requests on a thread pool and track progress.
+        
+        Requests are submitted through a sliding window of at most
+        REQUEST_WINDOW_PER_THREAD in-flight requests per worker, topped up as
+        requests complete, so memory stays proportional to the thread count
+        rather than to target_requests.
+        """
+        target_requests = self.config.target_requests
+        window_size = self.REQUEST_WINDOW_PER_THREAD * self.config.concurrent_threads
+        submitted_requests = 0
+        completed_requests = 0
+        error_count = 0
+        in_flight = set()
+        
+        # Create thread pool for concurrent requests
+        with ThreadPoolExecutor(max_workers=self.config.concurrent_threads) as executor:
+            while submitted_requests < target_requests or in_flight:
+                # Top up the window of in-flight requests
+                while (submitted_requests < target_requests and len(in_flight) < window_size
+                       and not self.control_file.should_stop()):
                     # Select random endpoint
-                    import random
-                    endpoint = random.choice(self.filtered_endpoints)
+                    template = self._rng.choice(self._request_templates)
                     
                     # Submit request to thread pool
-                    future = executor.submit(self._execute_single_request, endpoint, i)
-                    future_to_request[future] = i
+                    in_flight.add(executor.submit(self._execute_single_request, template, submitted_requests))
+                    submitted_requests += 1
                     
                     # Add delay between request submissions if configured
                     if self.config.request_delay_ms > 0:
                         time.sleep(self.config.request_delay_ms / 1000.0)
                 
-                # Wait for all requests to complete
-                completed_requests = 0
-                error_count = 0
+                if self.control_file.should_stop() or not in_flight:
+                    # Cancel requests that have not started yet
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
                 
-                for future in as_completed(future_to_request):
-                    if self.control_file.should_stop():
-                        # Cancel remaining futures
-                        for remaining_future in future_to_request:
-                            if not remaining_future.done():
-                                remaining_future.cancel()
-                        break
-                    
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                
+                for future in done:
                     # Check for pause
-                    while self.control_file.should_pause() and not self.control_file.should_stop():
-                        time.sleep(1)
+                    self.control_file.wait_while_paused()
                     
                     try:
                         result = future.result()
@@ -341,73 +568,71 @@ class SimulationEngine:
                     
                     # Update status callback
                     self._update_status_callback(completed_requests, error_count)
-            
-            # Finalize simulation
-            self.is_running = False
-            final_status = 'completed' if not self.control_file.should_stop() else 'stopped'
-            self.control_file.update_status(final_status)
-            
-            return True
-            
-        except Exception as e:
-            self.is_running = False
-            self.control_file.update_status('failed', error_message=str(e))
-            return False
     
-    def _execute_single_request(self, endpoint: Dict[str, Any], request_number: int) -> bool:
+    def _execute_single_request(self, template: RequestTemplate, request_number: int) -> bool:
         """Execute a single API request."""
+        # Wall-clock start for the record; the duration comes from the monotonic
+        # counter so it is exact and immune to system clock adjustments
         request_start_time = time.time()
+        started_ns = time.perf_counter_ns()
         request_id = f"{self.simulation_id}_{request_number}"
         
         try:
             # Generate request data
-            request_data = self.request_generator.generate_request_data(endpoint)
-            
-            # Build URL
-            base_url = self.swagger_parser.get_base_url()
-            path = endpoint['path']
-            
-            # Replace path parameters
-            for param_name, param_value in request_data['path_params'].items():
-                path = path.replace(f"{{{param_name}}}", str(param_value))
+            request_data = self.request_generator.generate_request_data(template.endpoint)
             
-            url = urljoin(base_url, path.lstrip('/'))
+            # Build URL, which is only known up front for endpoints without path parameters
+            url = template.url
+            if url is None:
+                path = template.path
+                
+                # Replace path parameters in a single pass over the path
+                path_params = request_data['path_params']
+                if path_params:
+                    path = _PATH_PARAM_PATTERN.sub(
+                        lambda match: str(path_params[match.group(1)]) if match.group(1) in path_params else match.group(0),
+                        path
+                    )
+                
+                url = urljoin(self._base_url, path.lstrip('/'))
             
             # Prepare headers
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': f'FakeSphere-Simulator/{self.simulation_id}'
-            }
+            headers = dict(self._base_headers)
             headers.update(self.auth_handler.get_auth_headers())
             headers.update(request_data['headers'])
             if self.config.custom_headers:
                 headers.update(self.config.custom_headers)
             
-            # Calculate request size
-            request_body = json.dumps(request_data['body']) if request_data['body'] else None
-            request_size = len(request_body.encode('utf-8')) if request_body else 0
+            # Serialize the body straight to bytes, which also gives its size
+            request_body = orjson.dumps(request_data['body']) if request_data['body'] else None
+            request_size = len(request_body) if request_body else 0
             
             # Make HTTP request
-            response = requests.request(
-                method=endpoint['method'],
+            response = self.session.request(
+                method=template.method,
                 url=url,
                 params=request_data['query_params'],
                 data=request_body,
                 headers=headers,
-                timeout=30
+                timeout=30,
+                stream=True
             )
             
-            request_end_time = time.time()
+            # Only the body's size is needed, so count it chunk by chunk instead of
+            # holding it in memory; draining it lets the connection be reused
+            with response:
+                response_size = 0
+                for chunk in response.iter_content(self.RESPONSE_CHUNK_SIZE):
+                    response_size += len(chunk)
             
-            # Calculate response size
-            response_size = len(response.content) if response.content else 0
+            request_end_time = request_start_time + (time.perf_counter_ns() - started_ns) / 1e9
             
-            # Record metrics
-            self.metrics_collector.record_request(
-                endpoint_path=endpoint['path'],
-                http_method=endpoint['method'],
-                target_host=requests.utils.urlparse(base_url).hostname,
-                target_port=requests.utils.urlparse(base_url).port or (443 if base_url.startswith('https') else 80),
+            # Queue metrics for the drainer thread
+            self._pending_metrics.append(dict(
+                endpoint_path=template.path,
+                http_method=template.method,
+                target_host=self._target_host,
+                target_port=self._target_port,
                 request_url=url,
                 request_size_bytes=request_size,
                 request_start_time=request_start_time,
@@ -417,17 +642,17 @@ class SimulationEngine:
                 response_message=response.reason,
                 auth_type=self.auth_handler.auth_type,
                 request_id=request_id
-            )
+            ))
             
             return True
             
         except Exception as e:
-            request_end_time = time.time()
+            request_end_time = request_start_time + (time.perf_counter_ns() - started_ns) / 1e9
             
-            # Record error metrics
-            self.metrics_collector.record_request(
-                endpoint_path=endpoint['path'],
-                http_method=endpoint['method'],
+            # Queue error metrics for the drainer thread
+            self._pending_metrics.append(dict(
+                endpoint_path=template.path,
+                http_method=template.method,
                 target_host="unknown",
                 target_port=0,
                 request_url=url if 'url' in locals() else "unknown",
@@ -440,23 +665,29 @@ class SimulationEngine:
                 error_message=str(e),
                 auth_type=self.auth_handler.auth_type,
                 request_id=request_id
-            )
+            ))
             
             return False
     
     def _update_status_callback(self, completed_requests: int, error_count: int) -> None:
-        """Update status and notify callbacks."""
+        """Publish the latest progress for the status dispatcher, replacing any undelivered one."""
         if not self.start_time:
             return
         
-        elapsed_time = time.time() - self.start_time
+        with self._status_cv:
+            self._status_slot = (completed_requests, error_count, time.time())
+            self._status_cv.notify()
+    
+    def _build_running_status(self, completed_requests: int, error_count: int, timestamp: float) -> SimulationStatus:
+        """Build the running status for a progress snapshot taken at timestamp."""
+        elapsed_time = timestamp - self.start_time
         progress_percent = (completed_requests / self.config.target_requests) * 100
         
         remaining_requests = self.config.target_requests - completed_requests
         current_rps = completed_requests / elapsed_time if elapsed_time > 0 else 0
         estimated_remaining_seconds = remaining_requests / current_rps if current_rps > 0 else 0
         
-        status = SimulationStatus(
+        return SimulationStatus(
             simulation_id=self.simulation_id,
             status='running',
             progress_percent=round(progress_percent, 2),
@@ -467,8 +698,6 @@ class SimulationEngine:
             current_rps=round(current_rps, 2),
             error_count=error_count
         )
-        
-        self._notify_status_change(status)
     
     def get_current_status(self) -> SimulationStatus:
         """Get current simulation status."""
@@ -521,55 +750,12 @@ class SimulationEngine:
     
     def cleanup(self) -> None:
         """Clean up simulation resources."""
+        self.session.close()
         self.control_file.cleanup()
     
     @classmethod
     def create_from_interactive_config(cls) -> 'SimulationEngine':
         """Create simulation engine through interactive configuration."""
-        print("🔥 Fake Sphere API Simulation Configuration")
-        print("=" * 50)
-        
-        # Collect basic configuration
-        simulation_name = input("Simulation name: ").strip()
-        api_source = input("Swagger/OpenAPI URL or file path: ").strip()
-        environment = input("Environment (dev/staging/production) [dev]: ").strip() or "dev"
-        target_requests = int(input("Number of requests to generate [100]: ") or "100")
-        concurrent_threads = int(input("Concurrent threads [5]: ") or "5")
-        request_delay_ms = int(input("Delay between requests (ms) [0]: ") or "0")
-        
-        # Authentication configuration
-        print("\nAuthentication Configuration:")
-        auth_type = input("Auth type (none/bearer/api_key/basic) [none]: ").strip() or "none"
-        
-        auth_config = {'type': auth_type}
-        if auth_type == 'bearer':
-            token_url = input("Token URL (or leave empty for static token): ").strip()
-            if token_url:
-                auth_config.update({
-                    'token_url': token_url,
-                    'client_id': input("Client ID: ").strip(),
-                    'client_secret': input("Client Secret: ").strip()
-                })
-            else:
-                auth_config['static_token'] = input("Static Bearer Token: ").strip()
-        elif auth_type == 'api_key':
-            auth_config.update({
-                'api_key': input("API Key: ").strip(),
-                'header_name': input("Header name [X-API-Key]: ").strip() or "X-API-Key"
-            })
-        
-        # Output configuration
-        output_directory = input("Output directory [./data/metrics]: ").strip() or "./data/metrics"
-        
-        config = SimulationConfig(
-            simulation_name=simulation_name,
-            api_source=api_source,
-            environment=environment,
-            target_requests=target_requests,
-            concurrent_threads=concurrent_threads,
-            request_delay_ms=request_delay_ms,
-            auth_config=auth_config,
-            output_directory=output_directory
-        )
+        from ..cli import prompt_simulation_config
         
-        return cls(config)
\ No newline at end of file
+        return cls(SimulationConfig(**prompt_simulation_config()))
\ No newline at end of file
@@ -8,24 +8,109 @@ This module parses Swagger/OpenAPI specifications to extract:
 - Authentication schemes
 """
 
-import json
+import io
 import yaml
 import requests
-from typing import Dict, List, Any, Optional, Union
-from urllib.parse import urlparse
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 import os
+import re
+
+import orjson
+
+# libyaml's C loader parses large specs several times faster when available
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# A URL with a scheme and a non-empty network location, as urlparse would split it
+_URL_PATTERN = re.compile(r'[A-Za-z][A-Za-z0-9+.\-]*://[^/?#]')
+
+# Path item keys that are operations; the rest are parameters, servers and the like
+_HTTP_METHODS = frozenset({'get', 'post', 'put', 'patch', 'delete', 'options', 'head'})
+
+
+def _stringify_int_keys(data: Any) -> Any:
+    """
+    Turn integer mapping keys into strings, in place, as JSON specs have them.
+    
+    YAML reads unquoted response codes such as 200 as ints. Walking the
+    document once with an explicit stack keeps YAML and JSON specs alike
+    without a JSON dump-and-reload round trip.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if any(type(key) is int for key in node):
+                items = list(node.items())
+                node.clear()
+                node.update((str(key) if type(key) is int else key, value) for key, value in items)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return data
 
 
 class SwaggerParser:
     """Parses Swagger/OpenAPI specifications from URLs or local files."""
     
+    # Suffix of the JSON cache written next to a parsed YAML spec file
+    CACHE_SUFFIX = '.cache.json'
+    
+    READ_BUFFER_SIZE = 64 * 1024
+    
+    # Upper bound on threads used by load_specifications
+    MAX_LOAD_WORKERS = 32
+    
     def __init__(self):
         self.spec_data: Optional[Dict[str, Any]] = None
         self.base_url: Optional[str] = None
-        self.endpoints: List[Dict[str, Any]] = []
+        # None until the loaded specification's endpoints are first needed
+        self._endpoints: Optional[List[Dict[str, Any]]] = []
         self.schemas: Dict[str, Any] = {}
         self.auth_schemes: Dict[str, Any] = {}
         
+        # Resolved $ref targets by pointer, shared across the endpoints using them
+        self._resolved_refs: Dict[str, Any] = {}
+        
+        # Inverted indexes over self.endpoints, rebuilt with it
+        self._endpoints_by_tag: Dict[str, List[Dict[str, Any]]] = {}
+        self._endpoints_by_method: Dict[str, List[Dict[str, Any]]] = {}
+        self._all_tags: Set[str] = set()
+        # Serializes the lazy endpoint extraction when a parser is shared between threads
+        self._extract_lock = threading.Lock()
+        
+        # get_specification_info's result for the loaded specification
+        self._info_cache: Optional[Dict[str, Any]] = None
+        
+    @classmethod
+    def load_specifications(cls, sources: List[str]) -> List[Optional['SwaggerParser']]:
+        """
+        Load several specifications concurrently, one parser per source.
+        
+        Downloads and file reads overlap across sources, which matters most
+        when loading a fleet of specs from remote URLs.
+        
+        Args:
+            sources: URLs or file paths to Swagger/OpenAPI specs
+            
+        Returns:
+            A parser per source in the same order, or None where loading failed
+        """
+        if not sources:
+            return []
+        
+        def load(source: str) -> Optional['SwaggerParser']:
+            parser = cls()
+            return parser if parser.load_specification(source) else None
+        
+        with ThreadPoolExecutor(max_workers=min(cls.MAX_LOAD_WORKERS, len(sources))) as executor:
+            return list(executor.map(load, sources))
+    
     def load_specification(self, source: str) -> bool:
         """
         Load Swagger specification from URL or local file path.
@@ -46,23 +131,28 @@ class SwaggerParser:
             return False
     
     def _is_url(self, source: str) -> bool:
-        """Check if source is a URL."""
-        try:
-            result = urlparse(source)
-            return all([result.scheme, result.netloc])
-        except:
-            return False
+        """Check if source is a URL, i.e. has both a scheme and a network location."""
+        return _URL_PATTERN.match(source) is not None
     
     def _load_from_url(self, url: str) -> bool:
         """Load specification from URL."""
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        content_type = response.headers.get('content-type', '').lower()
-        if 'json' in content_type:
-            self.spec_data = response.json()
-        else:
-            self.spec_data = yaml.safe_load(response.text)
+        with requests.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            
+            # Servers often mislabel specs, so tell JSON from YAML by the body's first byte
+            response.raw.decode_content = True
+            response.raw.auto_close = False  # Stay readable at EOF; the with-block closes it
+            body = io.BufferedReader(response.raw, buffer_size=self.READ_BUFFER_SIZE)
+            if body.peek(self.READ_BUFFER_SIZE).lstrip()[:1] in (b'{', b'['):
+                content = body.read()
+                try:
+                    self.spec_data = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # YAML flow style also starts with a bracket
+                    self.spec_data = _stringify_int_keys(yaml.load(content, Loader=_SafeLoader))
+            else:
+                # Let the YAML parser read the body as it arrives instead of buffering it first
+                self.spec_data = _stringify_int_keys(yaml.load(body, Loader=_SafeLoader))
         
         return self._parse_specification()
     
@@ -71,14 +161,54 @@ class SwaggerParser:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Specification file not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            if file_path.lower().endswith('.json'):
-                self.spec_data = json.load(f)
-            else:
-                self.spec_data = yaml.safe_load(f)
+        if file_path.lower().endswith('.json'):
+            with open(file_path, 'rb') as f:
+                self.spec_data = orjson.loads(f.read())
+        else:
+            self.spec_data = self._load_cached_yaml(file_path)
+            if self.spec_data is None:
+                # libyaml decodes the bytes itself; a large buffer keeps its reads few
+                with open(file_path, 'rb', buffering=self.READ_BUFFER_SIZE) as f:
+                    self.spec_data = _stringify_int_keys(yaml.load(f, Loader=_SafeLoader))
+                self._write_yaml_cache(file_path)
         
         return self._parse_specification()
     
+    def _load_cached_yaml(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Load the JSON cache of a YAML spec, or None if it is missing or stale."""
+        cache_path = file_path + self.CACHE_SUFFIX
+        try:
+            if os.stat(cache_path).st_mtime_ns < os.stat(file_path).st_mtime_ns:
+                return None
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+    
+    def _write_yaml_cache(self, file_path: str) -> None:
+        """Save the parsed YAML spec next to its source as JSON, when JSON can represent it exactly."""
+        try:
+            cached = orjson.dumps(self.spec_data)
+        except TypeError:
+            return  # Non-string keys and similar cannot round-trip through JSON
+        
+        # Dates and non-finite floats serialize but come back as other values
+        if orjson.loads(cached) != self.spec_data:
+            return
+        
+        cache_path = file_path + self.CACHE_SUFFIX
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(cached)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # The cache is only an optimization, e.g. the directory may be read-only
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
     def _parse_specification(self) -> bool:
         """Parse the loaded specification data."""
         if not self.spec_data:
@@ -93,8 +223,9 @@ class SwaggerParser:
         # Extract authentication schemes
         self._extract_auth_schemes()
         
-        # Extract endpoints
-        self._extract_endpoints()
+        # Endpoints are extracted on first access, since metadata-only callers never need them
+        self._endpoints = None
+        self._info_cache = None
         
         return True
     
@@ -130,41 +261,132 @@ class SwaggerParser:
         elif 'securityDefinitions' in self.spec_data:
             self.auth_schemes = self.spec_data['securityDefinitions']
     
+    @property
+    def endpoints(self) -> List[Dict[str, Any]]:
+        """Parsed endpoints, extracted from the specification on first access."""
+        if self._endpoints is None:
+            self._ensure_endpoints()
+        return self._endpoints
+    
+    def _ensure_endpoints(self):
+        """Extract the endpoints once, even when several threads ask at the same time."""
+        with self._extract_lock:
+            if self._endpoints is None:
+                self._extract_endpoints()
+    
     def _extract_endpoints(self):
         """Extract API endpoints and their details."""
-        if 'paths' not in self.spec_data:
-            return
+        self._resolved_refs = {}
+        
+        # Built locally and published together, endpoints last, so readers
+        # that see the endpoints also see the matching indexes
+        endpoints = []
+        endpoints_by_tag = defaultdict(list)
+        endpoints_by_method = defaultdict(list)
         
-        self.endpoints = []
+        # Bound once, since the loop below runs for every operation in the spec
+        add_endpoint = endpoints.append
+        resolve_refs = self._resolve_refs
+        extract_parameters = self._extract_parameters
+        extract_request_body = self._extract_request_body
         
-        for path, path_item in self.spec_data['paths'].items():
+        for path, path_item in self.spec_data.get('paths', {}).items():
             for method, operation in path_item.items():
-                if method.lower() in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']:
-                    endpoint = {
-                        'path': path,
-                        'method': method.upper(),
-                        'operation_id': operation.get('operationId'),
-                        'summary': operation.get('summary'),
-                        'description': operation.get('description'),
-                        'parameters': self._extract_parameters(operation.get('parameters', [])),
-                        'request_body': self._extract_request_body(operation.get('requestBody')),
-                        'responses': operation.get('responses', {}),
-                        'security': operation.get('security', []),
-                        'tags': operation.get('tags', [])
-                    }
-                    self.endpoints.append(endpoint)
+                if method.lower() not in _HTTP_METHODS:
+                    continue
+                
+                operation_get = operation.get
+                http_method = method.upper()
+                tags = operation_get('tags', [])
+                endpoint = {
+                    'path': path,
+                    'method': http_method,
+                    'operation_id': operation_get('operationId'),
+                    'summary': operation_get('summary'),
+                    'description': operation_get('description'),
+                    'parameters': extract_parameters(resolve_refs(operation_get('parameters', []))),
+                    'request_body': extract_request_body(resolve_refs(operation_get('requestBody'))),
+                    'responses': operation_get('responses', {}),
+                    'security': operation_get('security', []),
+                    'tags': tags
+                }
+                add_endpoint(endpoint)
+                endpoints_by_method[http_method].append(endpoint)
+                for tag in dict.fromkeys(tags):
+                    endpoints_by_tag[tag].append(endpoint)
+        
+        self._endpoints_by_tag = endpoints_by_tag
+        self._endpoints_by_method = endpoints_by_method
+        self._all_tags = set(endpoints_by_tag)
+        self._endpoints = endpoints
+    
+    def _resolve_refs(self, node: Any, resolving: Tuple[str, ...] = ()) -> Any:
+        """
+        Replace local $ref pointers in node with the objects they point to.
+        
+        Each reference is resolved once per specification and the result is
+        shared by every place that uses it. A reference met again while it is
+        still being resolved is recursive and is left in place. Containers
+        without references are returned as-is rather than copied.
+        
+        Args:
+            node: Part of the specification to resolve
+            resolving: References currently being resolved, outermost first
+            
+        Returns:
+            The node with its references resolved
+        """
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str) and ref.startswith('#/'):
+                resolved = self._resolved_refs.get(ref)
+                if resolved is not None:
+                    return resolved
+                if ref in resolving:
+                    return node
+                
+                target = self._ref_target(ref)
+                if target is None:
+                    return node
+                
+                resolved = self._resolve_refs(target, resolving + (ref,))
+                self._resolved_refs[ref] = resolved
+                return resolved
+            
+            resolved = {key: self._resolve_refs(value, resolving) for key, value in node.items()}
+            return resolved if any(resolved[key] is not node[key] for key in node) else node
+        
+        if isinstance(node, list):
+            resolved = [self._resolve_refs(item, resolving) for item in node]
+            return resolved if any(new is not old for new, old in zip(resolved, node)) else node
+        
+        return node
+    
+    def _ref_target(self, ref: str) -> Any:
+        """Look up a local JSON pointer such as '#/components/schemas/User', or None if missing."""
+        target = self.spec_data
+        for part in ref[2:].split('/'):
+            part = part.replace('~1', '/').replace('~0', '~')
+            if isinstance(target, dict) and part in target:
+                target = target[part]
+            elif isinstance(target, list) and part.isdigit() and int(part) < len(target):
+                target = target[int(part)]
+            else:
+                return None
+        return target
     
     def _extract_parameters(self, parameters: List[Dict]) -> List[Dict]:
         """Extract and normalize parameter definitions."""
         extracted = []
         for param in parameters:
+            param_get = param.get
             param_info = {
-                'name': param.get('name'),
-                'in': param.get('in'),  # query, path, header, cookie
-                'required': param.get('required', False),
-                'description': param.get('description'),
-                'schema': param.get('schema', param.get('type')),  # OpenAPI 3.x vs 2.0
-                'example': param.get('example')
+                'name': param_get('name'),
+                'in': param_get('in'),  # query, path, header, cookie
+                'required': param_get('required', False),
+                'description': param_get('description'),
+                'schema': param_get('schema', param_get('type')),  # OpenAPI 3.x vs 2.0
+                'example': param_get('example')
             }
             extracted.append(param_info)
         return extracted
@@ -190,11 +412,15 @@ class SwaggerParser:
     
     def get_endpoints_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """Get endpoints filtered by tag."""
-        return [ep for ep in self.endpoints if tag in ep.get('tags', [])]
+        if self._endpoints is None:
+            self._ensure_endpoints()
+        return list(self._endpoints_by_tag.get(tag, ()))
     
     def get_endpoints_by_method(self, method: str) -> List[Dict[str, Any]]:
         """Get endpoints filtered by HTTP method."""
-        return [ep for ep in self.endpoints if ep['method'] == method.upper()]
+        if self._endpoints is None:
+            self._ensure_endpoints()
+        return list(self._endpoints_by_method.get(method.upper(), ()))
     
     def get_schemas(self) -> Dict[str, Any]:
         """Get all schemas/definitions."""
@@ -213,15 +439,21 @@ class SwaggerParser:
         if not self.spec_data:
             return {}
         
-        info = self.spec_data.get('info', {})
-        return {
-            'title': info.get('title'),
-            'version': info.get('version'),
-            'description': info.get('description'),
-            'contact': info.get('contact'),
-            'license': info.get('license'),
-            'base_url': self.base_url,
-            'total_endpoints': len(self.endpoints),
-            'auth_schemes': list(self.auth_schemes.keys()),
-            'tags': list(set(tag for ep in self.endpoints for tag in ep.get('tags', [])))
-        }
\ No newline at end of file
+        if self._info_cache is None:
+            info = self.spec_data.get('info', {})
+            endpoints = self.endpoints
+            self._info_cache = {
+                'title': info.get('title'),
+                'version': info.get('version'),
+                'description': info.get('description'),
+                'contact': info.get('contact'),
+                'license': info.get('license'),
+                'base_url': self.base_url,
+                'total_endpoints': len(endpoints),
+                'auth_schemes': list(self.auth_schemes.keys()),
+                'tags': list(self._all_tags)
+            }
+        
+        # Copies keep callers from altering the cached lists
+        info = self._info_cache
+        return {**info, 'auth_schemes': list(info['auth_schemes']), 'tags': list(info['tags'])}
\ No newline at end of file
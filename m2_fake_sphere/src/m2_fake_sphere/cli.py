@@ -0,0 +1,63 @@
+"""
+Interactive Simulation Configuration
+
+Terminal prompts for configuring an API simulation. Kept apart from the
+simulation engine, whose create_from_interactive_config builds an engine
+from the answers; importing this module loads neither requests nor Faker.
+"""
+
+from typing import Any, Dict
+
+
+def prompt_simulation_config() -> Dict[str, Any]:
+    """
+    Collect simulation settings from the terminal.
+    
+    Returns:
+        Keyword arguments for SimulationConfig
+    """
+    print("🔥 Fake Sphere API Simulation Configuration")
+    print("=" * 50)
+    
+    # Collect basic configuration
+    simulation_name = input("Simulation name: ").strip()
+    api_source = input("Swagger/OpenAPI URL or file path: ").strip()
+    environment = input("Environment (dev/staging/production) [dev]: ").strip() or "dev"
+    target_requests = int(input("Number of requests to generate [100]: ") or "100")
+    concurrent_threads = int(input("Concurrent threads [5]: ") or "5")
+    request_delay_ms = int(input("Delay between requests (ms) [0]: ") or "0")
+    
+    # Authentication configuration
+    print("\nAuthentication Configuration:")
+    auth_type = input("Auth type (none/bearer/api_key/basic) [none]: ").strip() or "none"
+    
+    auth_config = {'type': auth_type}
+    if auth_type == 'bearer':
+        token_url = input("Token URL (or leave empty for static token): ").strip()
+        if token_url:
+            auth_config.update({
+                'token_url': token_url,
+                'client_id': input("Client ID: ").strip(),
+                'client_secret': input("Client Secret: ").strip()
+            })
+        else:
+            auth_config['static_token'] = input("Static Bearer Token: ").strip()
+    elif auth_type == 'api_key':
+        auth_config.update({
+            'api_key': input("API Key: ").strip(),
+            'header_name': input("Header name [X-API-Key]: ").strip() or "X-API-Key"
+        })
+    
+    # Output configuration
+    output_directory = input("Output directory [./data/metrics]: ").strip() or "./data/metrics"
+    
+    return {
+        'simulation_name': simulation_name,
+        'api_source': api_source,
+        'environment': environment,
+        'target_requests': target_requests,
+        'concurrent_threads': concurrent_threads,
+        'request_delay_ms': request_delay_ms,
+        'auth_config': auth_config,
+        'output_directory': output_directory
+    }
\ No newline at end of file
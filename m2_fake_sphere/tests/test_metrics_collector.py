@@ -0,0 +1,205 @@
+"""
+Metrics Collector Tests
+
+Checks that the running aggregates kept by MetricsCollector report the same
+statistics as values computed directly from the recorded requests.
+"""
+
+from collections import Counter
+
+import pytest
+
+from m2_fake_sphere.api_simulation.metrics_collector import MetricsCollector
+
+
+# (method, path, status code, response time in ms, error message)
+REQUESTS = [
+    ('GET', '/users', 200, 12.5, None),
+    ('GET', '/users', 200, 8.25, None),
+    ('GET', '/users', 404, 3.0, 'Not Found'),
+    ('POST', '/users', 201, 40.0, None),
+    ('POST', '/users', 400, 15.75, 'Bad Request'),
+    ('POST', '/users', 500, 120.0, 'Internal Server Error'),
+    ('GET', '/orders', 200, 22.0, None),
+    ('GET', '/orders', 302, 5.5, None),
+    ('GET', '/orders', 503, 250.0, 'Service Unavailable'),
+    ('GET', '/orders', 0, 1000.0, 'Connection refused'),
+    ('DELETE', '/orders/1', 204, 9.0, None),
+    ('DELETE', '/orders/1', 500, 95.5, 'Internal Server Error'),
+    ('DELETE', '/orders/1', 200, 11.0, 'Slow response'),
+    ('PUT', '/orders/1', 409, 18.0, 'Conflict'),
+    ('PUT', '/orders/1', 0, 1000.0, 'Connection refused'),
+    ('PUT', '/orders/1', 0, 30000.0, 'Read timed out'),
+    ('GET', '/users', 500, 130.0, 'Internal Server Error'),
+]
+
+
+def request_kwargs(index, method, path, status_code, response_time_ms, error_message):
+    """Keyword arguments for record_request describing one fixed request."""
+    start = 1000.0 + index
+    return {
+        'endpoint_path': path,
+        'http_method': method,
+        'target_host': 'localhost',
+        'target_port': 8080,
+        'request_url': f"http://localhost:8080{path}",
+        'request_size_bytes': 100,
+        'request_start_time': start,
+        'request_end_time': start + response_time_ms / 1000,
+        'status_code': status_code,
+        'response_size_bytes': 200,
+        'response_message': 'OK' if 200 <= status_code < 300 else 'Error',
+        'error_message': error_message,
+        'request_id': f"req-{index}"
+    }
+
+
+def record_all(collector, requests, batch=False):
+    kwargs = [request_kwargs(index, *request) for index, request in enumerate(requests)]
+    if batch:
+        collector.record_request_batch(kwargs)
+    else:
+        for request in kwargs:
+            collector.record_request(**request)
+    return kwargs
+
+
+def response_times(kwargs):
+    return [(request['request_end_time'] - request['request_start_time']) * 1000 for request in kwargs]
+
+
+def is_success(status_code):
+    return 200 <= status_code < 300
+
+
+def is_error(request):
+    return request['status_code'] >= 400 or bool(request['error_message'])
+
+
+def expected_endpoint_statistics(kwargs):
+    endpoints = {}
+    for request, response_time in zip(kwargs, response_times(kwargs)):
+        key = f"{request['http_method']} {request['endpoint_path']}"
+        endpoints.setdefault(key, []).append((request['status_code'], response_time))
+    
+    statistics = {}
+    for key, records in endpoints.items():
+        times = [response_time for _, response_time in records]
+        successful = sum(1 for status_code, _ in records if is_success(status_code))
+        statistics[key] = {
+            'total_requests': len(records),
+            'successful_requests': successful,
+            'failed_requests': len(records) - successful,
+            'status_codes': dict(Counter(status_code for status_code, _ in records)),
+            'avg_response_time_ms': round(sum(times) / len(times), 2),
+            'min_response_time_ms': round(min(times), 2),
+            'max_response_time_ms': round(max(times), 2),
+            'error_rate_percent': round((len(records) - successful) / len(records) * 100, 2)
+        }
+    return statistics
+
+
+def expected_error_analysis(kwargs):
+    errors = [request for request in kwargs if is_error(request)]
+    messages = Counter(request['error_message'] for request in errors if request['error_message'])
+    common = sorted(messages.items(), key=lambda item: item[1], reverse=True)[:5]
+    return {
+        'total_errors': len(errors),
+        'error_by_status_code': dict(Counter(str(request['status_code']) for request in errors)),
+        'error_by_endpoint': dict(Counter(
+            f"{request['http_method']} {request['endpoint_path']}" for request in errors
+        )),
+        'error_messages': dict(messages),
+        'common_errors': [{'message': message, 'count': count} for message, count in common]
+    }
+
+
+@pytest.fixture
+def collector(tmp_path):
+    return MetricsCollector('test-simulation', output_directory=str(tmp_path))
+
+
+@pytest.mark.parametrize('batch', [False, True])
+def test_summary_matches_inputs(collector, batch):
+    kwargs = record_all(collector, REQUESTS, batch=batch)
+    times = response_times(kwargs)
+    successful = sum(1 for request in kwargs if is_success(request['status_code']))
+    
+    summary = collector.finish_simulation()
+    
+    assert summary.total_requests == len(REQUESTS)
+    assert summary.successful_requests == successful
+    assert summary.failed_requests == len(REQUESTS) - successful
+    assert summary.avg_response_time_ms == round(sum(times) / len(times), 2)
+    assert summary.min_response_time_ms == round(min(times), 2)
+    assert summary.max_response_time_ms == round(max(times), 2)
+    assert summary.error_rate_percent == round((len(REQUESTS) - successful) / len(REQUESTS) * 100, 2)
+    assert summary.status_code_distribution == dict(Counter(request['status_code'] for request in kwargs))
+    assert summary.endpoint_statistics == expected_endpoint_statistics(kwargs)
+    assert collector.get_metrics_count() == len(REQUESTS)
+
+
+def test_current_statistics_match_inputs(collector):
+    kwargs = record_all(collector, REQUESTS)
+    times = response_times(kwargs)
+    successful = sum(1 for request in kwargs if is_success(request['status_code']))
+    
+    statistics = collector.get_current_statistics()
+    
+    assert statistics['total_requests'] == len(REQUESTS)
+    assert statistics['successful_requests'] == successful
+    assert statistics['failed_requests'] == len(REQUESTS) - successful
+    assert statistics['avg_response_time_ms'] == round(sum(times) / len(times), 2)
+    assert statistics['min_response_time_ms'] == round(min(times), 2)
+    assert statistics['max_response_time_ms'] == round(max(times), 2)
+    assert statistics['error_rate_percent'] == round((len(REQUESTS) - successful) / len(REQUESTS) * 100, 2)
+
+
+def test_endpoint_statistics_match_inputs(collector):
+    kwargs = record_all(collector, REQUESTS)
+    
+    assert collector.get_endpoint_statistics() == expected_endpoint_statistics(kwargs)
+    assert collector.get_status_code_distribution() == dict(Counter(request['status_code'] for request in kwargs))
+
+
+def test_error_analysis_matches_inputs(collector):
+    kwargs = record_all(collector, REQUESTS)
+    
+    error_analysis = collector.get_error_analysis()
+    
+    assert error_analysis == expected_error_analysis(kwargs)
+    assert error_analysis['common_errors'][0] == {'message': 'Internal Server Error', 'count': 3}
+    assert len(error_analysis['common_errors']) == 5
+
+
+def test_empty_collector(collector):
+    assert collector.get_metrics_count() == 0
+    assert collector.get_current_statistics()['total_requests'] == 0
+    assert collector.get_status_code_distribution() == {}
+    assert collector.get_endpoint_statistics() == {}
+    assert collector.get_error_analysis()['total_errors'] == 0
+    assert collector.get_error_analysis()['common_errors'] == []
+    
+    summary = collector.finish_simulation()
+    assert summary.total_requests == 0
+    assert summary.avg_response_time_ms == 0
+    assert summary.status_code_distribution == {}
+    assert summary.endpoint_statistics == {}
+
+
+def test_clear_metrics_then_record(collector):
+    record_all(collector, REQUESTS)
+    collector.clear_metrics()
+    
+    assert collector.get_metrics_count() == 0
+    assert collector.get_current_statistics()['total_requests'] == 0
+    assert collector.get_endpoint_statistics() == {}
+    
+    later = REQUESTS[:4]
+    kwargs = record_all(collector, later)
+    summary = collector.finish_simulation()
+    
+    assert summary.total_requests == len(later)
+    assert summary.endpoint_statistics == expected_endpoint_statistics(kwargs)
+    assert collector.get_error_analysis() == expected_error_analysis(kwargs)
+    assert collector.get_metrics_count() == len(later)
\ No newline at end of file
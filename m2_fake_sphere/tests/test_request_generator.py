@@ -0,0 +1,101 @@
+"""
+Request Generator Tests
+
+Checks that the indexed field-name matcher picks the same Faker method as a
+plain ordered scan over the field mappings.
+"""
+
+import random
+
+import pytest
+
+from m2_fake_sphere.api_simulation.request_generator import RequestGenerator
+
+
+@pytest.fixture(scope="module")
+def generator() -> RequestGenerator:
+    return RequestGenerator(seed=0)
+
+
+def ordered_scan(generator: RequestGenerator, field_name: str):
+    """Reference matcher: the first mapping whose pattern occurs in the name wins."""
+    for pattern, faker_method in generator.field_mappings:
+        if pattern.search(field_name):
+            return faker_method
+    return None
+
+
+def mapping_keywords(generator: RequestGenerator):
+    """Every literal keyword spelled out by the field mappings."""
+    keywords = set()
+    for pattern, _ in generator.field_mappings:
+        for alternative in pattern.pattern.strip('()').split('|'):
+            keywords.add(alternative.replace('_?', '_'))
+            keywords.add(alternative.replace('_?', ''))
+    return sorted(keywords)
+
+
+# Names containing keywords of several mappings, where mapping order decides
+MULTI_KEYWORD_NAMES = [
+    'user_email_address',
+    'first_name_last',
+    'company_phone',
+    'created_status_type',
+    'billing_address_city',
+    'account_number_id',
+    'updated_at_timestamp',
+    'display_name_title',
+    'order_price_currency',
+    'mac_address_ip',
+]
+
+
+def test_keywords_match_ordered_scan(generator):
+    for keyword in mapping_keywords(generator):
+        assert generator._match_field_name(keyword) == ordered_scan(generator, keyword), keyword
+
+
+def test_multi_keyword_names_match_ordered_scan(generator):
+    for name in MULTI_KEYWORD_NAMES:
+        hits = [method for pattern, method in generator.field_mappings if pattern.search(name)]
+        assert len(hits) > 1, name
+        assert generator._match_field_name(name) == hits[0], name
+
+
+def test_random_names_match_ordered_scan(generator):
+    rng = random.Random(1234)
+    keywords = mapping_keywords(generator)
+    alphabet = 'abcdefghijklmnopqrstuvwxyz_'
+    
+    for _ in range(20000):
+        parts = []
+        for _ in range(rng.randint(1, 4)):
+            if rng.random() < 0.5:
+                parts.append(rng.choice(keywords))
+            else:
+                parts.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))))
+        name = rng.choice(['', '_']).join(parts)
+        assert generator._match_field_name(name) == ordered_scan(generator, name), name
+
+
+def test_unmatched_names(generator):
+    for name in ['', 'q', 'xyz', 'foo_bar']:
+        assert generator._match_field_name(name) == ordered_scan(generator, name)
+
+def test_endpoint_plans_keyed_by_method_and_path():
+    generator = RequestGenerator(seed=0)
+    endpoint = {
+        'method': 'GET',
+        'path': '/users',
+        'parameters': [{'name': 'email', 'in': 'query', 'required': True, 'schema': {'type': 'string'}}]
+    }
+    plan = generator._endpoint_plan(endpoint)
+    
+    # Equal copies share the plan, while a different definition replaces it
+    assert generator._endpoint_plan({**endpoint, 'parameters': list(endpoint['parameters'])}) is plan
+    changed = {**endpoint, 'parameters': [{'name': 'phone', 'in': 'query', 'schema': {'type': 'string'}}]}
+    assert generator._endpoint_plan(changed).fields[0].name == 'phone'
+    
+    for index in range(RequestGenerator.MAX_ENDPOINT_PLANS + 10):
+        generator._endpoint_plan({'method': 'GET', 'path': f"/items/{index}"})
+    assert len(generator._endpoint_plans) == RequestGenerator.MAX_ENDPOINT_PLANS
\ No newline at end of file